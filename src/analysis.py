@@ -0,0 +1,139 @@
+from array import array
+from collections import Counter
+from grid import WallGrid
+from search import distance_field
+
+
+class MazeMetrics:
+    """Structural metrics of a generated maze.
+
+    Attributes:
+        distances (array): The number of steps from the entrance to each cell,
+        indexed like ``WallGrid.passages``, or ``-1`` if unreachable.
+        solution_length (int): The number of steps from the entrance to the
+        exit, or ``-1`` if the exit cannot be reached.
+        diameter (int): The number of steps along the longest shortest path in
+        the maze.
+        diameter_endpoints (tuple[int, int]): The indices of the cells at either
+        end of the longest path.
+        dead_ends (int): The number of cells with a single open side.
+        junctions (int): The number of cells with three or more open sides.
+        corridor_lengths (Counter[int]): How many corridors there are of each
+        length, where a corridor is a maximal chain of steps between cells that
+        do not have exactly two open sides.
+        branching_factor (float): The average number of open sides of the
+        junctions, or 0 if there are none.
+    """
+
+    def __init__(
+        self,
+        distances: array,
+        solution_length: int,
+        diameter: int,
+        diameter_endpoints: tuple[int, int],
+        dead_ends: int,
+        junctions: int,
+        corridor_lengths: Counter,
+        branching_factor: float,
+    ) -> None:
+        """Creates a new set of maze metrics. Each argument is stored as the
+        attribute of the same name.
+        """
+        self.distances = distances
+        self.solution_length = solution_length
+        self.diameter = diameter
+        self.diameter_endpoints = diameter_endpoints
+        self.dead_ends = dead_ends
+        self.junctions = junctions
+        self.corridor_lengths = corridor_lengths
+        self.branching_factor = branching_factor
+
+    def __repr__(self) -> str:
+        """Return a summary of the scalar metrics.
+
+        Returns:
+            str: String representing the metrics.
+        """
+        return (
+            f"MazeMetrics(solution_length={self.solution_length}, "
+            f"diameter={self.diameter}, dead_ends={self.dead_ends}, "
+            f"junctions={self.junctions}, "
+            f"branching_factor={self.branching_factor:.3f})"
+        )
+
+
+def _corridor_lengths(grid: WallGrid, degrees: bytearray) -> Counter:
+    """Walks every corridor once, starting from the cells that do not have
+    exactly two open sides.
+
+    Args:
+        grid (WallGrid): The grid to measure.
+        degrees (bytearray): The open side counts from ``WallGrid.degrees``.
+
+    Returns:
+        Counter: The number of corridors of each length.
+    """
+    lengths: Counter = Counter()
+    seen = bytearray(len(grid))
+    for start, degree in enumerate(degrees):
+        if degree == 2 or degree == 0:
+            continue
+        for first in grid.open_neighbors(start):
+            if degrees[first] != 2:
+                if start < first:
+                    lengths[1] += 1
+                continue
+            if seen[first]:
+                continue
+            previous, current, length = start, first, 1
+            while degrees[current] == 2:
+                seen[current] = 1
+                a, b = grid.open_neighbors(current)
+                previous, current = current, b if a == previous else a
+                length += 1
+            lengths[length] += 1
+    return lengths
+
+
+def analyze(
+    grid: WallGrid, entrance: int = 0, exit: int | None = None
+) -> MazeMetrics:
+    """Computes the metrics of a maze in time linear in the number of cells.
+
+    The diameter is found with a double breadth-first search, which is exact
+    for perfect mazes. On mazes with loops it is a lower bound.
+
+    Args:
+        grid (WallGrid): The grid to analyze.
+        entrance (int, optional): The index of the entrance cell. Defaults to 0.
+        exit (int | None, optional): The index of the exit cell. If ``None``,
+        the last cell of the grid. Defaults to None.
+
+    Returns:
+        MazeMetrics: The metrics of the maze.
+    """
+    if exit is None:
+        exit = len(grid) - 1
+    distances = distance_field(grid, [entrance])
+
+    farthest = distances.index(max(distances))
+    from_farthest = distance_field(grid, [farthest])
+    diameter = max(from_farthest)
+    other_end = from_farthest.index(diameter)
+
+    degrees = grid.degrees()
+    junction_degrees = [degree for degree in degrees if degree >= 3]
+    branching_factor = (
+        sum(junction_degrees) / len(junction_degrees) if junction_degrees else 0.0
+    )
+
+    return MazeMetrics(
+        distances=distances,
+        solution_length=distances[exit],
+        diameter=diameter,
+        diameter_endpoints=(farthest, other_end),
+        dead_ends=degrees.count(1),
+        junctions=len(junction_degrees),
+        corridor_lengths=_corridor_lengths(grid, degrees),
+        branching_factor=branching_factor,
+    )
@@ -0,0 +1,45 @@
+import random
+from grid import WallGrid, TOP, RIGHT, BOTTOM, LEFT
+
+
+def braid(grid: WallGrid, fraction: float, rng: random.Random) -> list[int]:
+    """Removes dead ends from a maze by opening a wall out of each one, which
+    adds loops to the maze. Walls into other dead ends are preferred, as that
+    removes two dead ends at once. Runs in a single pass over the grid.
+
+    Args:
+        grid (WallGrid): The grid to braid.
+        fraction (float): The fraction of dead ends to remove, from 0 to 1.
+        rng (random.Random): The random number generator to use.
+
+    Raises:
+        ValueError: Raises ValueError if ``fraction`` is not between 0 and 1.
+
+    Returns:
+        list[int]: The indices of every cell that had a wall opened.
+    """
+    if not 0 <= fraction <= 1:
+        raise ValueError("Braid fraction must be between 0 and 1")
+    degrees = grid.degrees()
+    dead_ends = [index for index, degree in enumerate(degrees) if degree == 1]
+    rng.shuffle(dead_ends)
+    changed = []
+    for index in dead_ends:
+        if degrees[index] != 1 or rng.random() >= fraction:
+            continue
+        candidates = []
+        for side in (TOP, RIGHT, BOTTOM, LEFT):
+            other = grid.neighbor(index, side)
+            if other is not None and grid.has_wall(index, side):
+                candidates.append((side, other))
+        if not candidates:
+            continue
+        preferred = [
+            (side, other) for side, other in candidates if degrees[other] == 1
+        ]
+        side, other = rng.choice(preferred or candidates)
+        grid.carve(index, side)
+        degrees[index] += 1
+        degrees[other] += 1
+        changed.extend((index, other))
+    return changed
@@ -0,0 +1,212 @@
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from array import array
+from grid import WallGrid, packed_size, read_packed_header
+
+_entry_suffix = ".maze"
+
+
+class CacheEntry:
+    """A maze read back from a ``MazeCache``.
+
+    Attributes:
+        grid (WallGrid): The cached walls of the maze.
+        solution (list[int] | None): The cached solution, as the grid indices of
+        the cells along it, or ``None`` if no solution was stored.
+    """
+
+    def __init__(self, grid: WallGrid, solution: list[int] | None) -> None:
+        """Creates a new cache entry.
+
+        Args:
+            grid (WallGrid): The cached walls of the maze.
+            solution (list[int] | None): The cached solution, if any.
+        """
+        self.grid = grid
+        self.solution = solution
+
+
+def encode_entry(grid: WallGrid, solution: list[int] | None = None) -> bytes:
+    """Encodes a maze and optionally its solution as the packed grid followed by
+    the grid index of each cell along the solution, as little-endian 64-bit
+    integers.
+
+    Args:
+        grid (WallGrid): The maze to encode.
+        solution (list[int] | None, optional): The grid indices of the cells
+        along the maze's solution. Defaults to None.
+
+    Returns:
+        bytes: The encoded maze.
+    """
+    data = grid.pack()
+    if solution is not None:
+        path_indices = array("q", solution)
+        if sys.byteorder != "little":
+            path_indices.byteswap()
+        data += path_indices.tobytes()
+    return data
+
+
+def decode_entry(data: bytes) -> CacheEntry:
+    """Decodes a maze encoded by ``encode_entry``.
+
+    Args:
+        data (bytes): The encoded maze.
+
+    Raises:
+        ValueError: Raises ValueError if ``data`` is not a valid encoded maze.
+
+    Returns:
+        CacheEntry: The decoded maze and solution.
+    """
+    grid_size = packed_size(*read_packed_header(data))
+    grid = WallGrid.unpack(data)
+    solution = None
+    if len(data) > grid_size:
+        if (len(data) - grid_size) % 8:
+            raise ValueError("Truncated maze solution")
+        path_indices = array("q")
+        path_indices.frombytes(data[grid_size:])
+        if sys.byteorder != "little":
+            path_indices.byteswap()
+        solution = path_indices.tolist()
+    return CacheEntry(grid, solution)
+
+
+class MazeCache:
+    """An on-disk cache of generated mazes, shared safely between processes.
+
+    Each entry is a single file named by a hash of the parameters that
+    generated the maze, holding the packed grid optionally followed by a
+    solution. Files are written to a temporary name and atomically renamed into
+    place, so readers never see a partial entry. Reading an entry updates its
+    modification time, and once the cache grows past its size cap the entries
+    that were least recently used are deleted.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 256 * 1024 * 1024) -> None:
+        """Opens a cache, creating its directory if needed.
+
+        Args:
+            directory (str): The directory to store entries in.
+            max_bytes (int, optional): The total size of entries to keep before
+            evicting. Defaults to 256 MiB.
+
+        Raises:
+            ValueError: Raises ValueError if ``max_bytes`` is negative.
+        """
+        if max_bytes < 0:
+            raise ValueError("Cache size cap cannot be negative")
+        os.makedirs(directory, exist_ok=True)
+        self._directory = directory
+        self._max_bytes = max_bytes
+
+    @staticmethod
+    def key(**params: object) -> str:
+        """Builds the cache key for a set of generation parameters.
+
+        Args:
+            **params (object): JSON-serializable parameters that fully determine
+            the generated maze, such as its size, seed and algorithm.
+
+        Returns:
+            str: A hex digest identifying the parameters.
+        """
+        encoded = json.dumps(params, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(encoded.encode()).hexdigest()
+
+    def _path(self, key: str) -> str:
+        """Returns the path of the file for an entry.
+
+        Args:
+            key (str): The key of the entry.
+
+        Returns:
+            str: The path of the entry's file.
+        """
+        return os.path.join(self._directory, key + _entry_suffix)
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Reads an entry, marking it as recently used.
+
+        Args:
+            key (str): The key of the entry, from ``MazeCache.key``.
+
+        Returns:
+            CacheEntry | None: The entry, or ``None`` if it is not cached or
+            could not be read.
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as file:
+                data = file.read()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        try:
+            return decode_entry(data)
+        except ValueError:
+            return None
+
+    def put(self, key: str, grid: WallGrid, solution: list[int] | None = None) -> None:
+        """Writes an entry atomically, replacing any existing entry with the
+        same key, then evicts entries if the cache is over its size cap.
+
+        Args:
+            key (str): The key of the entry, from ``MazeCache.key``.
+            grid (WallGrid): The maze to store.
+            solution (list[int] | None, optional): The grid indices of the cells
+            along the maze's solution, if it should be stored too. Defaults to
+            None.
+        """
+        data = encode_entry(grid, solution)
+        fd, temp_path = tempfile.mkstemp(dir=self._directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(data)
+            os.replace(temp_path, self._path(key))
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        self._evict()
+
+    def _evict(self) -> None:
+        """Deletes the least recently used entries until the cache is within
+        its size cap. Entries deleted concurrently by other processes are
+        skipped.
+        """
+        entries = []
+        total = 0
+        with os.scandir(self._directory) as scan:
+            for entry in scan:
+                if not entry.name.endswith(_entry_suffix):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, entry.path, stat.st_size))
+                total += stat.st_size
+        entries.sort()
+        for _, path, size in entries:
+            if total <= self._max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def clear(self) -> None:
+        """Deletes every entry in the cache."""
+        with os.scandir(self._directory) as scan:
+            for entry in scan:
+                if entry.name.endswith(_entry_suffix):
+                    try:
+                        os.unlink(entry.path)
+                    except FileNotFoundError:
+                        pass
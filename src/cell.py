@@ -1,7 +1,12 @@
-from typing_extensions import Self
-from window import Window
+from __future__ import annotations
+from typing import TYPE_CHECKING
 from point import Point
 from line import Line
+from grid import WallGrid, TOP, RIGHT, BOTTOM, LEFT
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+    from window import Window
 
 _cell_color = "black"
 _absent_color = "#d9d9d9"
@@ -18,6 +23,10 @@ class Cell:
         has_left_wall (bool): Whether the cell has a left wall
         visited (bool): Whether the cell has been visited yet during maze
         generation or solving.
+
+    The walls and visited flag are stored in a ``WallGrid``. A cell constructed
+    on its own gets a private single-cell grid, while a ``Maze`` hands out cells
+    that are views onto its shared grid.
     """
 
     def __init__(
@@ -27,6 +36,8 @@ class Cell:
         has_right_wall: bool = True,
         has_bottom_wall: bool = True,
         has_left_wall: bool = True,
+        grid: WallGrid | None = None,
+        index: int = 0,
     ) -> None:
         """Create a new cell representing a cell in a maze.
 
@@ -37,17 +48,131 @@ class Cell:
             has_right_wall (bool, optional): Whether the cell starts with a right wall. Defaults to True.
             has_bottom_wall (bool, optional): Whether the cell starts with a bottom wall. Defaults to True.
             has_left_wall (bool, optional): Whether the cell starts with a left wall. Defaults to True.
+            grid (WallGrid | None, optional): An existing grid to store the
+            cell's state in. When given, the cell is a view onto the grid and
+            the ``has_*_wall`` arguments are ignored. Defaults to None.
+            index (int, optional): The index of the cell within ``grid``.
+            Defaults to 0.
         """
         self._window = window
         self._x1 = None
         self._y1 = None
         self._x2 = None
         self._y2 = None
-        self.has_top_wall = has_top_wall
-        self.has_right_wall = has_right_wall
-        self.has_bottom_wall = has_bottom_wall
-        self.has_left_wall = has_left_wall
-        self.visited = False
+        if grid is None:
+            grid = WallGrid(1, 1)
+            grid.set_wall(0, TOP, has_top_wall)
+            grid.set_wall(0, RIGHT, has_right_wall)
+            grid.set_wall(0, BOTTOM, has_bottom_wall)
+            grid.set_wall(0, LEFT, has_left_wall)
+        self._grid = grid
+        self._index = index
+
+    @property
+    def has_top_wall(self) -> bool:
+        """Whether the cell has a top wall, read from its grid.
+
+        Returns:
+            bool: True if the top side is walled.
+        """
+        return self._grid.has_wall(self._index, TOP)
+
+    @has_top_wall.setter
+    def has_top_wall(self, value: bool) -> None:
+        """Adds or removes the cell's top wall in its grid, without touching
+        the neighboring cell.
+
+        Args:
+            value (bool): Whether the wall should exist.
+        """
+        self._grid.set_wall(self._index, TOP, value)
+
+    @property
+    def has_right_wall(self) -> bool:
+        """Whether the cell has a right wall, read from its grid.
+
+        Returns:
+            bool: True if the right side is walled.
+        """
+        return self._grid.has_wall(self._index, RIGHT)
+
+    @has_right_wall.setter
+    def has_right_wall(self, value: bool) -> None:
+        """Adds or removes the cell's right wall in its grid, without touching
+        the neighboring cell.
+
+        Args:
+            value (bool): Whether the wall should exist.
+        """
+        self._grid.set_wall(self._index, RIGHT, value)
+
+    @property
+    def has_bottom_wall(self) -> bool:
+        """Whether the cell has a bottom wall, read from its grid.
+
+        Returns:
+            bool: True if the bottom side is walled.
+        """
+        return self._grid.has_wall(self._index, BOTTOM)
+
+    @has_bottom_wall.setter
+    def has_bottom_wall(self, value: bool) -> None:
+        """Adds or removes the cell's bottom wall in its grid, without touching
+        the neighboring cell.
+
+        Args:
+            value (bool): Whether the wall should exist.
+        """
+        self._grid.set_wall(self._index, BOTTOM, value)
+
+    @property
+    def has_left_wall(self) -> bool:
+        """Whether the cell has a left wall, read from its grid.
+
+        Returns:
+            bool: True if the left side is walled.
+        """
+        return self._grid.has_wall(self._index, LEFT)
+
+    @has_left_wall.setter
+    def has_left_wall(self, value: bool) -> None:
+        """Adds or removes the cell's left wall in its grid, without touching
+        the neighboring cell.
+
+        Args:
+            value (bool): Whether the wall should exist.
+        """
+        self._grid.set_wall(self._index, LEFT, value)
+
+    @property
+    def visited(self) -> bool:
+        """Whether the cell has been visited, read from its grid.
+
+        Returns:
+            bool: True if the cell has been visited.
+        """
+        return bool(self._grid.visited[self._index])
+
+    @visited.setter
+    def visited(self, value: bool) -> None:
+        """Marks the cell as visited or not visited in its grid.
+
+        Args:
+            value (bool): Whether the cell has been visited.
+        """
+        self._grid.visited[self._index] = 1 if value else 0
+
+    def place(self, x1: int, y1: int, x2: int, y2: int) -> None:
+        """Sets the coordinates of the cell on the parent canvas without
+        drawing it, so moves to and from the cell can be drawn.
+
+        Args:
+            x1 (int): X-coordinate of the top-left corner of the cell.
+            y1 (int): Y-coordinate of the top-left corner of the cell.
+            x2 (int): X-coordinate of the bottom-right corner of the cell.
+            y2 (int): Y-coordinate of the bottom-right corner of the cell.
+        """
+        self._x1, self._y1, self._x2, self._y2 = x1, y1, x2, y2
 
     def draw(self, x1: int, y1: int, x2: int, y2: int) -> None:
         """Draws the cell to the parent canvas at the specified coordinates. If
@@ -61,7 +186,7 @@ class Cell:
             y2 (int): Y-coordinate of the bottom-right corner of the cell.
         """
         window = self._window
-        self._x1, self._y1, self._x2, self._y2 = x1, y1, x2, y2
+        self.place(x1, y1, x2, y2)
         if window is None:
             return
 
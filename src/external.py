@@ -0,0 +1,260 @@
+import mmap
+import tempfile
+from array import array
+from collections.abc import Iterator
+from grid import TOP, RIGHT, BOTTOM, LEFT, PACKED_HEADER, read_packed_header
+
+# Codes for the side of a cell its parent is on, stored two bits per cell.
+_parent_top = 0
+_parent_right = 1
+_parent_bottom = 2
+_parent_left = 3
+
+
+class _Frontier:
+    """A queue of cell indices that is written in full and then read back
+    once. Up to ``limit`` indices are held in memory, and beyond that they are
+    spilled to a temporary file in sorted runs, so that reading the next level
+    touches the maze file in mostly increasing order.
+    """
+
+    def __init__(self, limit: int, directory: str | None) -> None:
+        """Creates an empty frontier.
+
+        Args:
+            limit (int): The most indices to hold in memory at once.
+            directory (str | None): Where to create the spill file, or ``None``
+            for the default temporary directory.
+        """
+        self._limit = limit
+        self._directory = directory
+        self._buffer = array("q")
+        self._file = None
+        self._spilled = 0
+
+    def __len__(self) -> int:
+        """Returns the number of cells in the frontier.
+
+        Returns:
+            int: The number of spilled and buffered cells.
+        """
+        return self._spilled + len(self._buffer)
+
+    def extend(self, indices: array) -> None:
+        """Adds cells to the frontier, spilling to disk if the buffer is full.
+
+        Args:
+            indices (array): The indices of the cells.
+        """
+        self._buffer.extend(indices)
+        if len(self._buffer) >= self._limit:
+            self._spill()
+
+    def _spill(self) -> None:
+        """Writes the buffered indices to the spill file as one sorted run."""
+        if self._file is None:
+            self._file = tempfile.TemporaryFile(dir=self._directory)
+        self._file.write(array("q", sorted(self._buffer)).tobytes())
+        self._spilled += len(self._buffer)
+        self._buffer = array("q")
+
+    def chunks(self) -> Iterator[array]:
+        """Reads the frontier back, a bounded chunk at a time, then closes the
+        spill file.
+
+        Yields:
+            array: The next chunk of cell indices.
+        """
+        if self._file is not None:
+            self._file.seek(0)
+            chunk_bytes = self._limit * self._buffer.itemsize
+            while data := self._file.read(chunk_bytes):
+                chunk = array("q")
+                chunk.frombytes(data)
+                yield chunk
+            self._file.close()
+            self._file = None
+        yield self._buffer
+
+    def close(self) -> None:
+        """Deletes the spill file, if any."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def solve_file(
+    path: str,
+    start: int = 0,
+    goal: int | None = None,
+    frontier_limit: int = 1 << 20,
+    spill_directory: str | None = None,
+) -> list[int] | None:
+    """Finds a path with the fewest steps through a maze saved in the packed
+    format of ``WallGrid.pack``, without loading the maze into memory.
+
+    The file is memory-mapped and each cell's walls are read only when the
+    breadth-first search reaches it. Only a visited bitset and a bounded part
+    of the frontier are kept in memory; the rest of the frontier is spilled to
+    disk in sorted runs, and the side each cell was reached from is stored two
+    bits per cell in a temporary memory-mapped file, from which the path is
+    traced back once the goal is found.
+
+    Args:
+        path (str): The path of the packed maze, such as the output of
+        ``Maze.pack`` or an entry of a ``MazeCache``.
+        start (int, optional): The index of the cell to start from. Defaults to
+        the entrance, 0.
+        goal (int | None, optional): The index of the cell to reach. If
+        ``None``, the exit in the bottom right corner is used. Defaults to None.
+        frontier_limit (int, optional): How many frontier cells to buffer in
+        memory before spilling them to disk. Defaults to 1Mi cells.
+        spill_directory (str | None, optional): Where to create temporary
+        files, or ``None`` for the default temporary directory. Defaults to
+        None.
+
+    Raises:
+        ValueError: Raises ValueError if the file is not a packed maze,
+        ``start`` or ``goal`` are out of range, or ``frontier_limit`` is not at
+        least 1.
+
+    Returns:
+        list[int] | None: The grid indices of the cells along the path, or
+        ``None`` if the goal cannot be reached.
+    """
+    if frontier_limit <= 0:
+        raise ValueError("The frontier limit must be at least 1 cell")
+    with open(path, "rb") as file, mmap.mmap(
+        file.fileno(), 0, access=mmap.ACCESS_READ
+    ) as packed:
+        num_cols, num_rows = read_packed_header(packed)
+        num_cells = num_cols * num_rows
+        if goal is None:
+            goal = num_cells - 1
+        for cell in (start, goal):
+            if cell < 0 or cell >= num_cells:
+                raise ValueError(f"Invalid cell index: {cell}")
+        with tempfile.TemporaryFile(dir=spill_directory) as parent_file:
+            parent_file.truncate((num_cells + 3) // 4)
+            with mmap.mmap(parent_file.fileno(), 0) as parents:
+                if not _search(
+                    packed,
+                    parents,
+                    num_cols,
+                    num_cells,
+                    start,
+                    goal,
+                    frontier_limit,
+                    spill_directory,
+                ):
+                    return None
+                return _trace_path(parents, num_cols, start, goal)
+
+
+def _search(
+    packed: mmap.mmap,
+    parents: mmap.mmap,
+    num_cols: int,
+    num_cells: int,
+    start: int,
+    goal: int,
+    frontier_limit: int,
+    spill_directory: str | None,
+) -> bool:
+    """Runs a level-synchronous breadth-first search over a packed maze,
+    recording the side each cell was first reached from.
+
+    Args:
+        packed (mmap.mmap): The mapped packed maze.
+        parents (mmap.mmap): The writable mapped parent sides, two bits per
+        cell.
+        num_cols (int): The number of columns in the maze.
+        num_cells (int): The number of cells in the maze.
+        start (int): The index of the cell to start from.
+        goal (int): The index of the cell to reach.
+        frontier_limit (int): How many frontier cells to buffer in memory.
+        spill_directory (str | None): Where to create spill files.
+
+    Returns:
+        bool: Whether the goal was reached.
+    """
+    offset = PACKED_HEADER.size
+    last_row_start = num_cells - num_cols
+    visited = bytearray((num_cells + 7) // 8)
+
+    visited[start >> 3] |= 1 << (start & 7)
+    frontier = _Frontier(frontier_limit, spill_directory)
+    frontier.extend(array("q", [start]))
+    try:
+        while len(frontier):
+            if visited[goal >> 3] & (1 << (goal & 7)):
+                return True
+            next_frontier = _Frontier(frontier_limit, spill_directory)
+            for chunk in frontier.chunks():
+                # The cells reached from a chunk are handed to the next
+                # frontier together, so memory stays within a few chunks.
+                reached = array("q")
+                append = reached.append
+                for index in chunk:
+                    open_sides = packed[offset + (index >> 1)]
+                    open_sides = open_sides >> 4 if index & 1 else open_sides & 0x0F
+                    if not open_sides:
+                        continue
+                    col = index % num_cols
+                    if open_sides & TOP and index >= num_cols:
+                        other = index - num_cols
+                        mask = 1 << (other & 7)
+                        if not visited[other >> 3] & mask:
+                            visited[other >> 3] |= mask
+                            parents[other >> 2] |= _parent_bottom << (other & 3) * 2
+                            append(other)
+                    if open_sides & RIGHT and col != num_cols - 1:
+                        other = index + 1
+                        mask = 1 << (other & 7)
+                        if not visited[other >> 3] & mask:
+                            visited[other >> 3] |= mask
+                            parents[other >> 2] |= _parent_left << (other & 3) * 2
+                            append(other)
+                    if open_sides & BOTTOM and index < last_row_start:
+                        other = index + num_cols
+                        mask = 1 << (other & 7)
+                        if not visited[other >> 3] & mask:
+                            visited[other >> 3] |= mask
+                            parents[other >> 2] |= _parent_top << (other & 3) * 2
+                            append(other)
+                    if open_sides & LEFT and col != 0:
+                        other = index - 1
+                        mask = 1 << (other & 7)
+                        if not visited[other >> 3] & mask:
+                            visited[other >> 3] |= mask
+                            parents[other >> 2] |= _parent_right << (other & 3) * 2
+                            append(other)
+                next_frontier.extend(reached)
+            frontier.close()
+            frontier = next_frontier
+        return bool(visited[goal >> 3] & (1 << (goal & 7)))
+    finally:
+        frontier.close()
+
+
+def _trace_path(parents: mmap.mmap, num_cols: int, start: int, goal: int) -> list[int]:
+    """Follows the recorded parent sides back from the goal to the start.
+
+    Args:
+        parents (mmap.mmap): The mapped parent sides, two bits per cell.
+        num_cols (int): The number of columns in the maze.
+        start (int): The index of the cell the search started from.
+        goal (int): The index of the reached goal cell.
+
+    Returns:
+        list[int]: The grid indices of the cells from the start to the goal.
+    """
+    offsets = (-num_cols, 1, num_cols, -1)
+    path = [goal]
+    index = goal
+    while index != start:
+        parent_side = (parents[index >> 2] >> ((index & 3) * 2)) & 3
+        index += offsets[parent_side]
+        path.append(index)
+    path.reverse()
+    return path
@@ -0,0 +1,343 @@
+from __future__ import annotations
+import struct
+from array import array
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+MAX_COST = 0xFFFF
+
+# Packed grids start with a magic number, a format version, and the number of
+# columns and rows, followed by the passages of two cells per byte.
+PACKED_MAGIC = b"MAZE"
+PACKED_VERSION = 1
+PACKED_HEADER = struct.Struct("<4sBxxxII")
+
+TOP = 1
+RIGHT = 2
+BOTTOM = 4
+LEFT = 8
+ALL_SIDES = TOP | RIGHT | BOTTOM | LEFT
+
+OPPOSITE = {TOP: BOTTOM, RIGHT: LEFT, BOTTOM: TOP, LEFT: RIGHT}
+
+_open_side_counts = bytes(bin(passages).count("1") for passages in range(256))
+_low_nibbles = bytes(value & 0x0F for value in range(256))
+_high_nibbles = bytes(value >> 4 for value in range(256))
+_to_high_nibble = bytes((value << 4) & 0xFF for value in range(256))
+
+
+def packed_size(num_cols: int, num_rows: int) -> int:
+    """Returns the size of a packed grid, including its header.
+
+    Args:
+        num_cols (int): The number of columns in the grid.
+        num_rows (int): The number of rows in the grid.
+
+    Returns:
+        int: The number of bytes ``WallGrid.pack`` produces.
+    """
+    return PACKED_HEADER.size + (num_cols * num_rows + 1) // 2
+
+
+def read_packed_header(data) -> tuple[int, int]:
+    """Reads the dimensions of a packed grid from its header.
+
+    Args:
+        data: A bytes-like object starting with a packed grid.
+
+    Raises:
+        ValueError: Raises ValueError if ``data`` does not start with a packed
+        grid header, or is too short to hold the grid it describes.
+
+    Returns:
+        tuple[int, int]: The number of columns and rows in the grid.
+    """
+    if len(data) < PACKED_HEADER.size:
+        raise ValueError("Data is too short to be a packed grid")
+    magic, version, num_cols, num_rows = PACKED_HEADER.unpack_from(data)
+    if magic != PACKED_MAGIC or version != PACKED_VERSION:
+        raise ValueError("Data is not a packed grid")
+    if num_cols <= 0 or num_rows <= 0:
+        raise ValueError("Packed grid must have at least 1 row and 1 column")
+    if len(data) < packed_size(num_cols, num_rows):
+        raise ValueError("Packed grid is truncated")
+    return num_cols, num_rows
+
+
+class WallGrid:
+    """Compact storage for the walls and visited flags of a grid of cells.
+
+    Cells are stored row-major, so the cell in column ``i`` and row ``j`` lives
+    at index ``j * num_cols + i``. Rather than storing walls, each byte of
+    ``passages`` stores a bitmask of the sides (``TOP``, ``RIGHT``, ``BOTTOM``
+    and ``LEFT``) that have been opened, so a freshly allocated grid with every
+    wall standing is all zeros and costs no more than a single zeroed buffer.
+
+    Attributes:
+        num_cols (int): The number of columns in the grid.
+        num_rows (int): The number of rows in the grid.
+        passages (bytearray): The open sides of each cell.
+        visited (bytearray): Non-zero for each cell that has been visited.
+        costs (array | None): The cost of stepping into each cell, as unsigned
+        16-bit integers. ``None`` until a cost is first set, meaning every cell
+        costs 1.
+        version (int): Incremented whenever a wall or cost is changed through
+        the grid, so derived data can tell when it is stale.
+    """
+
+    def __init__(self, num_cols: int, num_rows: int) -> None:
+        """Creates a new grid with every wall standing and no cell visited.
+
+        Args:
+            num_cols (int): The number of columns in the grid.
+            num_rows (int): The number of rows in the grid.
+
+        Raises:
+            ValueError: Raises ValueError if ``num_cols`` or ``num_rows`` are
+            not at least 1.
+        """
+        if num_cols <= 0 or num_rows <= 0:
+            raise ValueError("Grid must have at least 1 row and 1 column")
+        self.num_cols = num_cols
+        self.num_rows = num_rows
+        self.passages = bytearray(num_cols * num_rows)
+        self.visited = bytearray(num_cols * num_rows)
+        self.costs: array | None = None
+        self.version = 0
+
+    def __len__(self) -> int:
+        """Returns the number of cells in the grid.
+
+        Returns:
+            int: The number of cells in the grid.
+        """
+        return len(self.passages)
+
+    def index(self, i: int, j: int) -> int:
+        """Returns the flat index of the cell at column ``i`` and row ``j``.
+
+        Args:
+            i (int): The column of the cell.
+            j (int): The row of the cell.
+
+        Returns:
+            int: The index of the cell in ``passages`` and ``visited``.
+        """
+        return j * self.num_cols + i
+
+    def coordinates(self, index: int) -> tuple[int, int]:
+        """Returns the column and row of the cell at a flat index.
+
+        Args:
+            index (int): The index of the cell.
+
+        Returns:
+            tuple[int, int]: The column and row of the cell.
+        """
+        j, i = divmod(index, self.num_cols)
+        return i, j
+
+    def neighbor(self, index: int, side: int) -> int | None:
+        """Returns the index of the cell across the given side of a cell.
+
+        Args:
+            index (int): The index of the cell.
+            side (int): One of ``TOP``, ``RIGHT``, ``BOTTOM`` or ``LEFT``.
+
+        Raises:
+            ValueError: Raises ValueError if ``side`` is not a single side.
+
+        Returns:
+            int | None: The index of the neighboring cell, or ``None`` if the
+            side is on the outer edge of the grid.
+        """
+        num_cols = self.num_cols
+        if side == TOP:
+            return index - num_cols if index >= num_cols else None
+        if side == RIGHT:
+            return index + 1 if index % num_cols != num_cols - 1 else None
+        if side == BOTTOM:
+            return index + num_cols if index + num_cols < len(self) else None
+        if side == LEFT:
+            return index - 1 if index % num_cols != 0 else None
+        raise ValueError(f"Invalid side: {side}")
+
+    def open_neighbors(self, index: int) -> list[int]:
+        """Returns the cells reachable from a cell in a single step, ignoring
+        any passages through the outer edge of the grid such as the entrance and
+        exit.
+
+        Args:
+            index (int): The index of the cell.
+
+        Returns:
+            list[int]: The indices of the reachable neighboring cells.
+        """
+        passages = self.passages[index]
+        neighbors = []
+        for side in (TOP, RIGHT, BOTTOM, LEFT):
+            if passages & side:
+                other = self.neighbor(index, side)
+                if other is not None:
+                    neighbors.append(other)
+        return neighbors
+
+    def degrees(self) -> bytearray:
+        """Counts the open sides of every cell, ignoring passages through the
+        outer edge of the grid such as the entrance and exit.
+
+        Returns:
+            bytearray: The number of neighbors reachable from each cell.
+        """
+        degrees = self.passages.translate(_open_side_counts)
+        passages = self.passages
+        num_cols = self.num_cols
+        last_row_start = len(self) - num_cols
+        for index in range(num_cols):
+            if passages[index] & TOP:
+                degrees[index] -= 1
+            if passages[last_row_start + index] & BOTTOM:
+                degrees[last_row_start + index] -= 1
+        for index in range(0, len(self), num_cols):
+            if passages[index] & LEFT:
+                degrees[index] -= 1
+            if passages[index + num_cols - 1] & RIGHT:
+                degrees[index + num_cols - 1] -= 1
+        return degrees
+
+    def has_wall(self, index: int, side: int) -> bool:
+        """Checks whether a single side of a cell has a wall.
+
+        Args:
+            index (int): The index of the cell.
+            side (int): One of ``TOP``, ``RIGHT``, ``BOTTOM`` or ``LEFT``.
+
+        Returns:
+            bool: Whether the side has a wall.
+        """
+        return not self.passages[index] & side
+
+    def set_wall(self, index: int, side: int, present: bool) -> None:
+        """Adds or removes the wall on a single side of a cell, without
+        touching the neighboring cell.
+
+        Args:
+            index (int): The index of the cell.
+            side (int): One of ``TOP``, ``RIGHT``, ``BOTTOM`` or ``LEFT``.
+            present (bool): Whether the wall should exist.
+        """
+        if present:
+            self.passages[index] &= ~side & ALL_SIDES
+        else:
+            self.passages[index] |= side
+        self.version += 1
+
+    def carve(self, index: int, side: int) -> int:
+        """Removes the wall between a cell and its neighbor on the given side,
+        from both cells.
+
+        Args:
+            index (int): The index of the cell.
+            side (int): One of ``TOP``, ``RIGHT``, ``BOTTOM`` or ``LEFT``.
+
+        Raises:
+            ValueError: Raises ValueError if the side is on the outer edge of
+            the grid.
+
+        Returns:
+            int: The index of the neighboring cell.
+        """
+        other = self.neighbor(index, side)
+        if other is None:
+            raise ValueError(f"Cell {index} has no neighbor on side {side}")
+        self.passages[index] |= side
+        self.passages[other] |= OPPOSITE[side]
+        self.version += 1
+        return other
+
+    def cost(self, index: int) -> int:
+        """Returns the cost of stepping into a cell.
+
+        Args:
+            index (int): The index of the cell.
+
+        Returns:
+            int: The cost of the cell.
+        """
+        return 1 if self.costs is None else self.costs[index]
+
+    def set_cost(self, index: int, cost: int) -> None:
+        """Sets the cost of stepping into a cell, allocating the cost array
+        the first time a cost is set.
+
+        Args:
+            index (int): The index of the cell.
+            cost (int): The new cost of the cell.
+
+        Raises:
+            ValueError: Raises ValueError if ``cost`` is not between 1 and
+            ``MAX_COST``.
+        """
+        if cost < 1 or cost > MAX_COST:
+            raise ValueError(f"Cell costs must be between 1 and {MAX_COST}")
+        if self.costs is None:
+            self.costs = array("H", [1]) * len(self)
+        self.costs[index] = cost
+        self.version += 1
+
+    def cost_range(self) -> tuple[int, int]:
+        """Returns the lowest and highest cell costs.
+
+        Returns:
+            tuple[int, int]: The minimum and maximum cost of any cell.
+        """
+        if self.costs is None:
+            return 1, 1
+        return min(self.costs), max(self.costs)
+
+    def pack(self) -> bytes:
+        """Serializes the walls of the grid, storing the open sides of two
+        cells in each byte. Visited flags and costs are not included.
+
+        Returns:
+            bytes: The packed grid.
+        """
+        passages = self.passages
+        low = passages[0::2]
+        high = passages[1::2].translate(_to_high_nibble)
+        # Combine the two halves with a single big integer OR, rather than a
+        # Python loop over every byte.
+        packed = (
+            int.from_bytes(low, "little") | int.from_bytes(high, "little")
+        ).to_bytes(len(low), "little")
+        header = PACKED_HEADER.pack(
+            PACKED_MAGIC, PACKED_VERSION, self.num_cols, self.num_rows
+        )
+        return header + packed
+
+    @classmethod
+    def unpack(cls, data) -> Self:
+        """Creates a grid from the output of ``pack``.
+
+        Args:
+            data: A bytes-like object starting with a packed grid.
+
+        Raises:
+            ValueError: Raises ValueError if ``data`` is not a packed grid.
+
+        Returns:
+            Self: A new grid with the packed walls and no cells visited.
+        """
+        num_cols, num_rows = read_packed_header(data)
+        grid = cls(num_cols, num_rows)
+        num_cells = len(grid)
+        packed = bytes(data[PACKED_HEADER.size : packed_size(num_cols, num_rows)])
+        grid.passages[0::2] = packed.translate(_low_nibbles)[: (num_cells + 1) // 2]
+        grid.passages[1::2] = packed.translate(_high_nibbles)[: num_cells // 2]
+        return grid
+
+    def reset_visited(self) -> None:
+        """Marks every cell as not visited."""
+        self.visited = bytearray(len(self))
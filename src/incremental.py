@@ -0,0 +1,308 @@
+import heapq
+from array import array
+from collections.abc import Iterable
+from grid import WallGrid, TOP, RIGHT, BOTTOM, LEFT
+from search import UNREACHED, cheapest_path, distance_field
+
+# The distance of a cell that has not been reached, which is larger than the
+# cost of any path through a grid.
+_INFINITY = 1 << 62
+
+# Once a repair has expanded more than this share of the cells, finishing it
+# would cost more than searching again from scratch.
+_REPAIR_SHARE = 0.02
+
+
+class IncrementalPlanner:
+    """Keeps a cheapest path between two cells up to date as walls are opened
+    and closed or cell costs change, using Lifelong Planning A*. After a change
+    only the cells whose distance from the start is affected are searched
+    again, rather than the whole maze.
+
+    Distances are stored in flat arrays, and queue entries pack a cell's
+    priority and index into one integer, which is cheaper to compare than a
+    tuple. While every cell costs 1, the first search is a single breadth-first
+    search. A repair that expands more than a small share of the cells is
+    abandoned and the path found from scratch instead, by the same
+    breadth-first search or by ``search.cheapest_path`` if cells have costs.
+
+    Attributes:
+        start (int): The index of the cell paths start at.
+        goal (int): The index of the cell paths end at.
+        min_cost (int): The lowest cell cost when the planner was created,
+        which scales the heuristic. Costs must not be lowered below it.
+        version (int): The ``WallGrid.version`` the planner was last updated
+        to. Changes made to the grid without calling ``update_cells`` leave the
+        planner stale.
+    """
+
+    def __init__(self, grid: WallGrid, start: int, goal: int) -> None:
+        """Creates a new planner. No searching is done until a path is first
+        requested.
+
+        Args:
+            grid (WallGrid): The grid to plan paths through.
+            start (int): The index of the cell paths start at.
+            goal (int): The index of the cell paths end at.
+
+        Raises:
+            ValueError: Raises ValueError if ``start`` or ``goal`` are out of
+            range.
+        """
+        if not 0 <= start < len(grid) or not 0 <= goal < len(grid):
+            raise ValueError("Start and goal must be cells of the grid")
+        self._grid = grid
+        self.start = start
+        self.goal = goal
+        self.version = grid.version
+        self.min_cost = grid.cost_range()[0]
+        # Ties between equal estimates go to the cell with the lower distance,
+        # which is the one with the larger heuristic, so a priority needs room
+        # for every heuristic value.
+        self._span = (grid.num_cols + grid.num_rows) * self.min_cost + 1
+        self._repair_limit = int(len(grid) * _REPAIR_SHARE)
+        self._reset()
+
+    def _reset(self) -> None:
+        """Discards all distances, leaving only the start queued."""
+        num_cells = len(self._grid)
+        self._g = array("q", [_INFINITY]) * num_cells
+        self._rhs = array("q", [_INFINITY]) * num_cells
+        self._rhs[self.start] = 0
+        # The queue entry of each cell that is queued, or -1. Other entries
+        # for the cell in the heap are stale and skipped.
+        self._queued = [-1] * num_cells
+        self._queue: list[int] = []
+        self._searched = False
+        self._push(self.start)
+
+    def _seed(self) -> None:
+        """Settles the distance of every cell with a single breadth-first
+        search, which is far cheaper than expanding the cells one at a time
+        but only valid while every cell costs 1.
+        """
+        g = array("q", distance_field(self._grid, (self.start,)))
+        if UNREACHED in g:
+            for index, distance in enumerate(g):
+                if distance == UNREACHED:
+                    g[index] = _INFINITY
+        self._g = g
+        self._rhs = array("q", g)
+        self._queued = [-1] * len(self._g)
+        self._queue = []
+        self._searched = True
+
+    def _entry(self, index: int) -> int:
+        """Returns the queue entry of a cell with its current priority.
+
+        Args:
+            index (int): The index of the cell.
+
+        Returns:
+            int: The packed priority and index, lowest first.
+        """
+        num_cols = self._grid.num_cols
+        goal_row, goal_col = divmod(self.goal, num_cols)
+        row, col = divmod(index, num_cols)
+        estimate = (abs(col - goal_col) + abs(row - goal_row)) * self.min_cost
+        best = min(self._g[index], self._rhs[index])
+        span = self._span
+        key = (best + estimate) * span + span - 1 - estimate
+        return key * len(self._queued) + index
+
+    def _push(self, index: int) -> None:
+        """Queues a cell if its distance is inconsistent with its one-step
+        lookahead distance, superseding any earlier entry for the same cell.
+
+        Args:
+            index (int): The index of the cell.
+        """
+        if self._g[index] == self._rhs[index]:
+            self._queued[index] = -1
+            return
+        entry = self._entry(index)
+        self._queued[index] = entry
+        heapq.heappush(self._queue, entry)
+
+    def _lookahead(self, index: int) -> int:
+        """Returns the cost of reaching a cell through its cheapest open
+        neighbor.
+
+        Args:
+            index (int): The index of the cell.
+
+        Returns:
+            int: The one-step lookahead distance, or ``_INFINITY`` if no
+            neighbor has been reached.
+        """
+        grid = self._grid
+        g = self._g
+        num_cols = grid.num_cols
+        open_sides = grid.passages[index]
+        col = index % num_cols
+        best = _INFINITY
+        if open_sides & TOP and index >= num_cols:
+            best = min(best, g[index - num_cols])
+        if open_sides & RIGHT and col != num_cols - 1:
+            best = min(best, g[index + 1])
+        if open_sides & BOTTOM and index < len(g) - num_cols:
+            best = min(best, g[index + num_cols])
+        if open_sides & LEFT and col != 0:
+            best = min(best, g[index - 1])
+        if best == _INFINITY:
+            return _INFINITY
+        return best + grid.cost(index)
+
+    def _compute(self) -> bool:
+        """Expands queued cells until the goal's distance is settled.
+
+        Returns:
+            bool: Whether the goal's distance was settled, or ``False`` if a
+            repair was abandoned for expanding too many cells.
+        """
+        grid = self._grid
+        if not self._searched and grid.costs is None:
+            self._seed()
+        passages = grid.passages
+        costs = grid.costs
+        num_cols = grid.num_cols
+        num_cells = len(passages)
+        last_row_start = num_cells - num_cols
+        goal_row, goal_col = divmod(self.goal, num_cols)
+        min_cost = self.min_cost
+        span = self._span
+        goal = self.goal
+        g = self._g
+        rhs = self._rhs
+        queued = self._queued
+        queue = self._queue
+        limit = self._repair_limit if self._searched else _INFINITY
+
+        expanded = 0
+        while queue:
+            entry = queue[0]
+            index = entry % num_cells
+            if queued[index] != entry:
+                heapq.heappop(queue)
+                continue
+            if g[goal] == rhs[goal]:
+                goal_key = g[goal] * span + span - 1
+                if entry >= goal_key * num_cells:
+                    break
+            if expanded >= limit:
+                return False
+            expanded += 1
+            heapq.heappop(queue)
+            queued[index] = -1
+            # The start's lookahead distance is always 0, so no step can
+            # lower it or leave it depending on this cell.
+            open_sides = passages[index]
+            col = index % num_cols
+            neighbors = []
+            if open_sides & TOP and index >= num_cols:
+                neighbors.append(index - num_cols)
+            if open_sides & RIGHT and col != num_cols - 1:
+                neighbors.append(index + 1)
+            if open_sides & BOTTOM and index < last_row_start:
+                neighbors.append(index + num_cols)
+            if open_sides & LEFT and col != 0:
+                neighbors.append(index - 1)
+            if g[index] > rhs[index]:
+                # The cell's distance fell, so it can only lower its neighbors'.
+                distance = g[index] = rhs[index]
+                for other in neighbors:
+                    candidate = distance + (1 if costs is None else costs[other])
+                    if candidate >= rhs[other]:
+                        continue
+                    rhs[other] = candidate
+                    if g[other] == candidate:
+                        queued[other] = -1
+                        continue
+                    row, other_col = divmod(other, num_cols)
+                    estimate = (
+                        abs(other_col - goal_col) + abs(row - goal_row)
+                    ) * min_cost
+                    best = min(g[other], candidate)
+                    key = (best + estimate) * span + span - 1 - estimate
+                    queued[other] = entry = key * num_cells + other
+                    heapq.heappush(queue, entry)
+            else:
+                # The cell's distance rose, so neighbors reached through it
+                # must look for another way in.
+                previous = g[index]
+                g[index] = _INFINITY
+                for other in neighbors:
+                    cost = 1 if costs is None else costs[other]
+                    if rhs[other] == previous + cost:
+                        rhs[other] = self._lookahead(other)
+                        self._push(other)
+                self._push(index)
+        self._searched = True
+        return True
+
+    def update_cells(self, cells: Iterable[int]) -> None:
+        """Notifies the planner that the walls or costs of the given cells
+        have changed. The cells on both sides of a changed wall must be
+        included.
+
+        Args:
+            cells (Iterable[int]): The indices of the cells that changed.
+
+        Raises:
+            ValueError: Raises ValueError if a cell now costs less than
+            ``min_cost``, as the heuristic could then overestimate.
+        """
+        cells = list(cells)
+        for index in cells:
+            if self._grid.cost(index) < self.min_cost:
+                raise ValueError("Cell costs cannot be lowered below min_cost")
+        for index in cells:
+            if index != self.start:
+                self._rhs[index] = self._lookahead(index)
+            self._push(index)
+        self.version = self._grid.version
+
+    def shortest_path(self) -> list[int] | None:
+        """Returns a cheapest path from the start to the goal, repairing the
+        previous search to account for any changed cells.
+
+        Returns:
+            list[int] | None: The indices of the cells along the path, including
+            both ends, or ``None`` if the goal cannot be reached.
+        """
+        grid = self._grid
+        if not self._compute():
+            # The change reached so much of the maze that searching again from
+            # scratch is cheaper than finishing the repair. Without cell costs
+            # that search also rebuilds the planner, so later repairs resume.
+            self._reset()
+            if grid.costs is not None:
+                return cheapest_path(grid, self.start, self.goal)
+            self._compute()
+        g = self._g
+        if g[self.goal] == _INFINITY:
+            return None
+        passages = grid.passages
+        num_cols = grid.num_cols
+        last_row_start = len(passages) - num_cols
+        path = [self.goal]
+        index = self.goal
+        while index != self.start:
+            # The cost of stepping into a cell is the same from every neighbor,
+            # so the cheapest predecessor is the one with the lowest distance.
+            open_sides = passages[index]
+            col = index % num_cols
+            best = _INFINITY
+            for side, other, exists in (
+                (TOP, index - num_cols, index >= num_cols),
+                (RIGHT, index + 1, col != num_cols - 1),
+                (BOTTOM, index + num_cols, index < last_row_start),
+                (LEFT, index - 1, col != 0),
+            ):
+                if open_sides & side and exists and g[other] < best:
+                    best = g[other]
+                    previous = other
+            index = previous
+            path.append(index)
+        path.reverse()
+        return path
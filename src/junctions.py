@@ -0,0 +1,331 @@
+import heapq
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterable
+from grid import WallGrid, TOP, RIGHT, BOTTOM, LEFT
+
+# Maps a cell's number of open sides to whether it is a node of the graph.
+_node_degrees = bytes(0 if degree == 2 else 1 for degree in range(256))
+
+
+class JunctionGraph:
+    """A maze contracted to its junctions and dead ends. Every corridor of
+    cells with exactly two open sides is collapsed into a single weighted edge,
+    so searches only visit the cells where a choice can be made. The weight of
+    a corridor is the total ``WallGrid.cost`` of the cells stepped into along
+    it, so it can differ between the two directions.
+
+    The graph is stored in flat arrays: nodes are numbered in grid order, the
+    edges leaving each node are contiguous, and the cells inside every
+    corridor are recorded once so paths are expanded by slicing rather than by
+    walking the grid again. Dead-end branches that cannot lie between two of
+    the remaining nodes are pruned at build time, so searches between the
+    ``keep`` cells or other unpruned nodes never enter them.
+
+    Attributes:
+        version (int): The ``WallGrid.version`` the graph was built from. The
+        graph is stale once the grid's version differs.
+    """
+
+    def __init__(self, grid: WallGrid, keep: Iterable[int] = ()) -> None:
+        """Builds the junction graph of a grid in a single linear pass.
+
+        Args:
+            grid (WallGrid): The grid to contract.
+            keep (Iterable[int], optional): Cells to keep as nodes even if they
+            lie in the middle of a corridor, such as the start and goal of later
+            searches. Defaults to ().
+        """
+        self.version = grid.version
+        num_cells = len(grid)
+        num_cols = grid.num_cols
+        self._num_cols = num_cols
+        is_node = grid.degrees().translate(_node_degrees)
+        kept = bytearray(num_cells)
+        for index in keep:
+            is_node[index] = 1
+            kept[index] = 1
+
+        # The node number of each node cell, or -1 for corridor cells.
+        node_ids = array("l", [-1]) * num_cells
+        cells = array("l", (index for index in range(num_cells) if is_node[index]))
+        for node, index in enumerate(cells):
+            node_ids[index] = node
+        self._node_ids = node_ids
+        self._cells = cells
+
+        # Each corridor is walked once, from whichever end is reached first,
+        # and recorded as an edge in both directions. An edge's corridor is the
+        # slice ``corridors[start:end]``, read backwards for reversed edges.
+        passages = grid.passages
+        costs = grid.costs
+        last_row_start = num_cells - num_cols
+        edges: list[list[tuple[int, int, int, int, int]]] = [[] for _ in cells]
+        corridors = array("l")
+        walked = bytearray(num_cells)
+        for node, cell in enumerate(cells):
+            for first, back in self._open_sides(passages, num_cols, cell):
+                if is_node[first]:
+                    if cell < first:
+                        other = node_ids[first]
+                        start = len(corridors)
+                        edges[node].append(
+                            (other, _cost(costs, first), start, start, 0)
+                        )
+                        edges[other].append(
+                            (node, _cost(costs, cell), start, start, 1)
+                        )
+                    continue
+                if walked[first]:
+                    continue
+                start = len(corridors)
+                interior = 0
+                current = first
+                while not is_node[current]:
+                    walked[current] = 1
+                    corridors.append(current)
+                    interior += 1 if costs is None else costs[current]
+                    open_sides = passages[current] & ~back
+                    if open_sides & TOP and current >= num_cols:
+                        current, back = current - num_cols, BOTTOM
+                    elif open_sides & RIGHT and current % num_cols != num_cols - 1:
+                        current, back = current + 1, LEFT
+                    elif open_sides & BOTTOM and current < last_row_start:
+                        current, back = current + num_cols, TOP
+                    else:
+                        current, back = current - 1, RIGHT
+                end = len(corridors)
+                other = node_ids[current]
+                edges[node].append(
+                    (other, interior + _cost(costs, current), start, end, 0)
+                )
+                edges[other].append(
+                    (node, interior + _cost(costs, cell), start, end, 1)
+                )
+        self._corridors = corridors
+
+        offsets = array("l", [0])
+        targets = array("l")
+        weights = array("l")
+        spans = array("l")
+        reversed_edges = bytearray()
+        for node_edges in edges:
+            for other, weight, start, end, backwards in node_edges:
+                targets.append(other)
+                weights.append(weight)
+                spans.append(start)
+                spans.append(end)
+                reversed_edges.append(backwards)
+            offsets.append(len(targets))
+        self._offsets = offsets
+        self._targets = targets
+        self._weights = weights
+        self._spans = spans
+        self._reversed = reversed_edges
+
+        # Repeatedly remove nodes with at most one remaining neighbor that are
+        # not kept. What is removed are trees hanging off a single node, which
+        # no path between two remaining nodes can pass through.
+        pruned = bytearray(len(cells))
+        remaining = array("l", (len(node_edges) for node_edges in edges))
+        leaves = [
+            node
+            for node in range(len(cells))
+            if remaining[node] <= 1 and not kept[cells[node]]
+        ]
+        while leaves:
+            node = leaves.pop()
+            pruned[node] = 1
+            for edge in range(offsets[node], offsets[node + 1]):
+                other = targets[edge]
+                if pruned[other]:
+                    continue
+                remaining[other] -= 1
+                if remaining[other] == 1 and not kept[cells[other]]:
+                    leaves.append(other)
+        self._pruned = pruned
+        self._min_cost = grid.cost_range()[0]
+
+    @staticmethod
+    def _open_sides(
+        passages: bytearray, num_cols: int, index: int
+    ) -> list[tuple[int, int]]:
+        """Lists the neighbors a cell has open passages to, ignoring the outer
+        edge of the grid.
+
+        Args:
+            passages (bytearray): The passages of the grid.
+            num_cols (int): The number of columns in the grid.
+            index (int): The index of the cell.
+
+        Returns:
+            list[tuple[int, int]]: The index of each open neighbor and the side
+            of that neighbor which leads back to the cell.
+        """
+        open_sides = passages[index]
+        col = index % num_cols
+        neighbors = []
+        if open_sides & TOP and index >= num_cols:
+            neighbors.append((index - num_cols, BOTTOM))
+        if open_sides & RIGHT and col != num_cols - 1:
+            neighbors.append((index + 1, LEFT))
+        if open_sides & BOTTOM and index < len(passages) - num_cols:
+            neighbors.append((index + num_cols, TOP))
+        if open_sides & LEFT and col != 0:
+            neighbors.append((index - 1, RIGHT))
+        return neighbors
+
+    def __len__(self) -> int:
+        """Returns the number of nodes in the graph.
+
+        Returns:
+            int: The number of junctions, dead ends and kept cells.
+        """
+        return len(self._cells)
+
+    def neighbors(self, node: int) -> list[tuple[int, int, int]]:
+        """Lists the corridors leaving a node.
+
+        Args:
+            node (int): The index of the node's cell.
+
+        Raises:
+            ValueError: Raises ValueError if ``node`` is not a node of the
+            graph.
+
+        Returns:
+            list[tuple[int, int, int]]: The ``(other_node, weight, first_cell)``
+            of every corridor leaving the node, where ``first_cell`` is the
+            first cell stepped into along the corridor.
+        """
+        node_id = self._node_id(node)
+        neighbors = []
+        for edge in range(self._offsets[node_id], self._offsets[node_id + 1]):
+            cells = self._corridor(edge)
+            other = self._cells[self._targets[edge]]
+            first = cells[0] if cells else other
+            neighbors.append((other, self._weights[edge], first))
+        return neighbors
+
+    def _node_id(self, index: int) -> int:
+        """Returns the node number of a cell.
+
+        Args:
+            index (int): The index of the cell.
+
+        Raises:
+            ValueError: Raises ValueError if the cell is not a node.
+
+        Returns:
+            int: The node number.
+        """
+        if not 0 <= index < len(self._node_ids) or self._node_ids[index] < 0:
+            raise ValueError("Start and goal must be nodes of the junction graph")
+        return self._node_ids[index]
+
+    def _corridor(self, edge: int) -> array:
+        """Returns the cells inside the corridor of an edge.
+
+        Args:
+            edge (int): The edge number.
+
+        Returns:
+            array: The cells between the two nodes, in the edge's direction.
+        """
+        cells = self._corridors[self._spans[2 * edge] : self._spans[2 * edge + 1]]
+        if self._reversed[edge]:
+            cells.reverse()
+        return cells
+
+    def shortest_path(self, start: int, goal: int) -> list[int] | None:
+        """Finds a cheapest path between two nodes with A* on the contracted
+        graph, then expands it back into cells.
+
+        Args:
+            start (int): The index of the first cell of the path.
+            goal (int): The index of the last cell of the path.
+
+        Raises:
+            ValueError: Raises ValueError if ``start`` or ``goal`` are not
+            nodes of the graph.
+
+        Returns:
+            list[int] | None: The indices of the cells along the path, including
+            both ends, or ``None`` if the goal cannot be reached.
+        """
+        start_id = self._node_id(start)
+        goal_id = self._node_id(goal)
+        num_nodes = len(self._cells)
+        # Pruned branches only need searching when an end lies inside one.
+        skip = self._pruned
+        if skip[start_id] or skip[goal_id]:
+            skip = bytearray(num_nodes)
+
+        cells = self._cells
+        offsets = self._offsets
+        targets = self._targets
+        weights = self._weights
+        num_cols = self._num_cols
+        goal_col, goal_row = goal % num_cols, goal // num_cols
+        min_cost = self._min_cost
+
+        # Every step costs at least ``min_cost``, so the Manhattan distance
+        # scaled by it never overestimates, and the first time a node is popped
+        # its distance is final. Queue entries pack the estimate and node into
+        # one integer, which is cheaper to compare than a tuple.
+        distances = array("l", [-1]) * num_nodes
+        via = array("l", [-1]) * num_nodes
+        done = bytearray(num_nodes)
+        distances[start_id] = 0
+        queue = [start_id]
+        while queue:
+            node = heapq.heappop(queue) % num_nodes
+            if node == goal_id:
+                break
+            if done[node]:
+                continue
+            done[node] = 1
+            distance = distances[node]
+            for edge in range(offsets[node], offsets[node + 1]):
+                other = targets[edge]
+                if skip[other] or done[other]:
+                    continue
+                candidate = distance + weights[edge]
+                if distances[other] < 0 or candidate < distances[other]:
+                    distances[other] = candidate
+                    via[other] = edge
+                    other_cell = cells[other]
+                    remaining = abs(other_cell % num_cols - goal_col) + abs(
+                        other_cell // num_cols - goal_row
+                    )
+                    heapq.heappush(
+                        queue,
+                        (candidate + min_cost * remaining) * num_nodes + other,
+                    )
+        if distances[goal_id] < 0:
+            return None
+
+        path_edges = []
+        node = goal_id
+        while node != start_id:
+            edge = via[node]
+            path_edges.append(edge)
+            node = bisect_right(self._offsets, edge) - 1
+        path = [start]
+        for edge in reversed(path_edges):
+            path.extend(self._corridor(edge))
+            path.append(cells[targets[edge]])
+        return path
+
+
+def _cost(costs: array | None, index: int) -> int:
+    """Returns the cost of stepping into a cell.
+
+    Args:
+        costs (array | None): The ``WallGrid.costs`` of the grid.
+        index (int): The index of the cell.
+
+    Returns:
+        int: The cost of the cell.
+    """
+    return 1 if costs is None else costs[index]
@@ -1,5 +1,9 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
 from point import Point
-from tkinter import Canvas
+
+if TYPE_CHECKING:
+    from tkinter import Canvas
 
 
 class Line:
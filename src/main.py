@@ -33,4 +33,5 @@ def main():
     win.wait_for_close()
 
 
-main()
+if __name__ == "__main__":
+    main()
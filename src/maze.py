@@ -1,8 +1,25 @@
+from __future__ import annotations
 import random
+from array import array
+from collections.abc import Iterable, Iterator
+from contextlib import AbstractContextManager, nullcontext
 from enum import Enum
+from typing import TYPE_CHECKING
 from time import sleep
-from window import Window
 from cell import Cell
+from grid import WallGrid, TOP, RIGHT, BOTTOM, LEFT
+from analysis import MazeMetrics, analyze
+from braid import braid as braid_dead_ends
+from incremental import IncrementalPlanner
+from junctions import JunctionGraph
+from profiler import Profiler
+from raster import rasterize
+from search import cheapest_path, distance_field, shortest_path
+from tiling import generate_tiled
+
+if TYPE_CHECKING:
+    from cache import CacheEntry, MazeCache
+    from window import Window
 
 
 class Direction(Enum):
@@ -12,6 +29,188 @@ class Direction(Enum):
     LEFT = "LEFT"
 
 
+class Algorithm(Enum):
+    """Maze generation algorithms.
+
+    ``BACKTRACKER`` is the animated recursive backtracker. ``TILED`` carves
+    blocks of the grid in parallel worker processes and stitches them together,
+    which is suited to mazes far too large to animate.
+    """
+
+    BACKTRACKER = "BACKTRACKER"
+    TILED = "TILED"
+
+
+class SolveMethod(Enum):
+    """Maze solving methods.
+
+    ``DFS`` is the animated depth-first search, which explores and draws every
+    dead end it tries, and returns the first path it finds. On a braided maze
+    that is usually not the shortest one. ``BFS`` finds a path with the fewest
+    steps with a breadth-first search and only draws the final path. The
+    remaining methods find the cheapest path given the cell costs set with
+    ``Maze.set_cell_cost``. ``DIJKSTRA`` runs A* on a bucket queue.
+    ``JUNCTION`` searches the maze's ``JunctionGraph``, which is built once and
+    reused until the walls change. ``INCREMENTAL`` keeps an
+    ``IncrementalPlanner`` that repairs the previous search after walls or costs
+    are changed through the ``Maze``.
+    """
+
+    DFS = "DFS"
+    BFS = "BFS"
+    DIJKSTRA = "DIJKSTRA"
+    JUNCTION = "JUNCTION"
+    INCREMENTAL = "INCREMENTAL"
+
+
+class RenderMode(Enum):
+    """Ways of drawing the maze's walls.
+
+    ``VECTOR`` draws every wall as its own canvas line and animates each cell
+    as it changes. ``IMAGE`` rasterizes all of the walls into a single image,
+    which is redrawn in one step whenever the walls change, and is far faster
+    for large mazes. Solving moves are drawn as lines in both modes.
+    """
+
+    VECTOR = "VECTOR"
+    IMAGE = "IMAGE"
+
+
+# Matches the default width of a ``Line``.
+_wall_width = 2
+
+_direction_sides = {
+    Direction.UP: (TOP, BOTTOM),
+    Direction.RIGHT: (RIGHT, LEFT),
+    Direction.DOWN: (BOTTOM, TOP),
+    Direction.LEFT: (LEFT, RIGHT),
+}
+
+
+class _CellColumn:
+    """A single column of a ``_CellGrid``, indexable by row."""
+
+    def __init__(self, cells: _CellGrid, i: int) -> None:
+        """Creates a view of a single column.
+
+        Args:
+            cells (_CellGrid): The grid of cells the column belongs to.
+            i (int): The index of the column.
+        """
+        self._cells = cells
+        self._i = i
+
+    def __len__(self) -> int:
+        """Returns the number of rows in the column.
+
+        Returns:
+            int: The number of rows.
+        """
+        return self._cells._grid.num_rows
+
+    def __getitem__(self, j: int) -> Cell:
+        """Returns the cell in a row of the column, creating it if needed.
+
+        Args:
+            j (int): The index of the row. Negative indices count from the
+            bottom.
+
+        Raises:
+            IndexError: Raises IndexError if ``j`` is out of range.
+
+        Returns:
+            Cell: The cell at row ``j``.
+        """
+        num_rows = self._cells._grid.num_rows
+        if j < 0:
+            j += num_rows
+        if j < 0 or j >= num_rows:
+            raise IndexError(f"Row index out of range: {j}")
+        return self._cells._get(self._i, j)
+
+    def __iter__(self) -> Iterator[Cell]:
+        """Iterates over the cells of the column from top to bottom.
+
+        Yields:
+            Cell: The cell in each row.
+        """
+        for j in range(len(self)):
+            yield self[j]
+
+
+class _CellGrid:
+    """Lazily materialized ``Cell`` views onto a ``WallGrid``, indexed as
+    ``cells[column][row]``. A ``Cell`` is only created the first time it is
+    accessed, after which the same object is returned.
+    """
+
+    def __init__(self, grid: WallGrid, window: Window | None = None) -> None:
+        """Creates cell views onto a grid, without creating any cells yet.
+
+        Args:
+            grid (WallGrid): The grid the cells are views onto.
+            window (Window | None, optional): The window the cells are drawn
+            in. Defaults to None.
+        """
+        self._grid = grid
+        self._window = window
+        self._materialized: dict[int, Cell] = {}
+
+    def __len__(self) -> int:
+        """Returns the number of columns.
+
+        Returns:
+            int: The number of columns.
+        """
+        return self._grid.num_cols
+
+    def __getitem__(self, i: int) -> _CellColumn:
+        """Returns a column of cells.
+
+        Args:
+            i (int): The index of the column. Negative indices count from the
+            right.
+
+        Raises:
+            IndexError: Raises IndexError if ``i`` is out of range.
+
+        Returns:
+            _CellColumn: The column at index ``i``.
+        """
+        num_cols = self._grid.num_cols
+        if i < 0:
+            i += num_cols
+        if i < 0 or i >= num_cols:
+            raise IndexError(f"Column index out of range: {i}")
+        return _CellColumn(self, i)
+
+    def __iter__(self) -> Iterator[_CellColumn]:
+        """Iterates over the columns from left to right.
+
+        Yields:
+            _CellColumn: Each column.
+        """
+        for i in range(len(self)):
+            yield self[i]
+
+    def _get(self, i: int, j: int) -> Cell:
+        """Returns the cell at a column and row, creating it on first access.
+
+        Args:
+            i (int): The column of the cell.
+            j (int): The row of the cell.
+
+        Returns:
+            Cell: The cell, which is the same object on every call.
+        """
+        index = self._grid.index(i, j)
+        cell = self._materialized.get(index)
+        if cell is None:
+            cell = Cell(self._window, grid=self._grid, index=index)
+            self._materialized[index] = cell
+        return cell
+
+
 class Maze:
     """Represents a 2D maze that can be drawn and animated on the parent ``Window``"""
 
@@ -25,6 +224,9 @@ class Maze:
         cell_height: int,
         window: Window | None = None,
         seed: int | float | str | bytes | bytearray | None = None,
+        profiler: Profiler | None = None,
+        render_mode: RenderMode = RenderMode.VECTOR,
+        cache: MazeCache | None = None,
     ) -> None:
         """Creates a new 2D maze parented to the specified ``Window``.
 
@@ -37,16 +239,21 @@ class Maze:
             cell_height (int): The number of pixels high each cell should be.
             window (Window | None): The parent window to draw the maze on.
             seed (int | float | str | bytes | bytearray | None): The seed used
-            to generate the maze. If ``None``, no initial seed will be used.
-            Defaults to ``None``.
+            to generate the maze, by this maze's own random number generator.
+            If ``None``, no initial seed will be used. Defaults to ``None``.
+            profiler (Profiler | None): Optional profiler to record counters
+            and phase timings into. Defaults to ``None``.
+            render_mode (RenderMode): How to draw the walls of the maze.
+            Defaults to ``RenderMode.VECTOR``.
+            cache (MazeCache | None): Optional cache of generated mazes and
+            their solutions. Only used when a ``seed`` is given, as otherwise
+            the maze cannot be reproduced. Defaults to ``None``.
 
         Raises:
             ValueError: Raises ValueError if:
               - ``num_rows`` or ``num_cols`` are not at least 1.
               - ``cell_height`` or ``cell_width`` are not at least 1.
         """
-        if seed is not None:
-            random.seed(seed)
         if num_rows <= 0 or num_cols <= 0:
             raise ValueError("Maze must have at least 1 row and 1 column")
         if cell_height <= 0 or cell_width <= 0:
@@ -54,42 +261,154 @@ class Maze:
                 "Maze cells must be at least 1 pixel wide and 1 pixel tall"
             )
         self._win = window
+        self._seed = seed
+        self._rng = random.Random(seed)
+        self._cache = cache
+        self._cache_key: str | None = None
+        self._cache_version = -1
         self._x1 = x1
         self._y1 = y1
         self._num_rows = num_rows
         self._num_cols = num_cols
         self._cell_width = cell_width
         self._cell_height = cell_height
-        self._cells: list[list[Cell]] = []
-        self._create_cells()
+        self._profiler = profiler
+        self._render_mode = render_mode
+        self._image_item: int | None = None
+        self._grid = WallGrid(num_cols, num_rows)
+        self._cells = _CellGrid(self._grid, window)
+        self._junctions: JunctionGraph | None = None
+        self._planner: IncrementalPlanner | None = None
+        with self._phase("create_cells"):
+            self._create_cells()
+
+    def _phase(self, name: str) -> AbstractContextManager:
+        """Returns a context manager timing the named phase on the attached
+        profiler, or a no-op context manager if there is no profiler.
 
-    def _create_cells(self) -> None:
-        """Initializes all the cells in the maze and then draws them."""
-        for x in range(self._num_cols):
-            self._cells.append([])
-            for y in range(self._num_rows):
-                self._cells[x].append(Cell(self._win))
-        for i in range(len(self._cells)):
-            for j in range(len(self._cells[i])):
-                self._draw_cell(i, j)
+        Args:
+            name (str): The name of the phase being timed.
 
-    def _draw_cell(self, i: int, j: int) -> None:
-        """Draws a single cell based on its column and row within the maze, and
-        animates the drawing. If no Window is provided at construction, this
-        function is a no-op.
+        Returns:
+            AbstractContextManager: The context manager to time the phase with.
+        """
+        if self._profiler is None:
+            return nullcontext()
+        return self._profiler.phase(name)
+
+    def _index(self, i: int, j: int) -> int:
+        """Returns the grid index of the cell at the given column and row.
 
         Args:
-            i (int): The column of the cell to draw
-            j (int): The row of the cell to draw
+            i (int): The column of the cell.
+            j (int): The row of the cell.
+
+        Raises:
+            ValueError: Raises ValueError if ``i`` or ``j`` are out of bounds
+            based on the maze's number of columns or rows.
+
+        Returns:
+            int: The index of the cell within the maze's ``WallGrid``.
+        """
+        if i >= self._num_cols or j >= self._num_rows or i < 0 or j < 0:
+            raise ValueError(f"Invalid cell index provided: ({i}, {j})")
+        return self._grid.index(i, j)
+
+    def _create_cells(self) -> None:
+        """Draws every cell of the grid with a single animation frame. Cells
+        themselves are created lazily on first access, so without a Window this
+        function is a no-op.
         """
         if self._win is None:
             return
+        if self._render_mode is RenderMode.IMAGE:
+            self._render_image()
+            self._animate()
+            return
+        for i in range(self._num_cols):
+            for j in range(self._num_rows):
+                self._draw_cell(i, j, animate=False)
+        self._animate()
+
+    def _render_image(self) -> None:
+        """Rasterizes the walls of the whole maze and shows them as a single
+        image, replacing any image drawn before. If no Window is provided at
+        construction, this function is a no-op.
+        """
+        if self._win is None:
+            return
+        with self._phase("render"):
+            if self._profiler is not None:
+                self._profiler.count("draw_calls")
+            ppm = rasterize(
+                self._grid, self._cell_width, self._cell_height, _wall_width
+            )
+            offset = _wall_width // 2
+            self._image_item = self._win.draw_image(
+                ppm, self._x1 - offset, self._y1 - offset, self._image_item
+            )
+
+    def _cell_bounds(self, i: int, j: int) -> tuple[int, int, int, int]:
+        """Returns the coordinates of a cell on the canvas.
+
+        Args:
+            i (int): The column of the cell
+            j (int): The row of the cell
+
+        Returns:
+            tuple[int, int, int, int]: The X and Y coordinates of the top-left
+            corner of the cell, followed by those of the bottom-right corner.
+        """
         cell_x1 = self._x1 + self._cell_width * i
         cell_y1 = self._y1 + self._cell_height * j
         cell_x2 = cell_x1 + self._cell_width
         cell_y2 = cell_y1 + self._cell_height
-        self._cells[i][j].draw(cell_x1, cell_y1, cell_x2, cell_y2)
-        self._animate()
+        return cell_x1, cell_y1, cell_x2, cell_y2
+
+    def _draw_cell(self, i: int, j: int, animate: bool = True) -> None:
+        """Draws a single cell based on its column and row within the maze, and
+        animates the drawing. If no Window is provided at construction, or the
+        maze is drawn as a single image, this function is a no-op.
+
+        Args:
+            i (int): The column of the cell to draw
+            j (int): The row of the cell to draw
+            animate (bool, optional): Whether to animate after drawing.
+            Defaults to True.
+        """
+        if self._win is None or self._render_mode is RenderMode.IMAGE:
+            return
+        with self._phase("render"):
+            if self._profiler is not None:
+                self._profiler.count("draw_calls")
+            self._cells[i][j].draw(*self._cell_bounds(i, j))
+        if animate:
+            self._animate()
+
+    def _draw_move(
+        self, i: int, j: int, to_i: int, to_j: int, undo: bool = False
+    ) -> None:
+        """Draws a move between two cells, recording it with the profiler. If
+        no Window is provided at construction, this function is a no-op.
+
+        Args:
+            i (int): The column of the cell the move starts from.
+            j (int): The row of the cell the move starts from.
+            to_i (int): The column of the cell the move ends at.
+            to_j (int): The row of the cell the move ends at.
+            undo (bool, optional): Whether the move is an undone move. Defaults
+            to False.
+        """
+        if self._win is None:
+            return
+        with self._phase("render"):
+            if self._profiler is not None:
+                self._profiler.count("draw_calls")
+            from_cell = self._cells[i][j]
+            to_cell = self._cells[to_i][to_j]
+            from_cell.place(*self._cell_bounds(i, j))
+            to_cell.place(*self._cell_bounds(to_i, to_j))
+            from_cell.draw_move(to_cell, undo)
 
     def _animate(self) -> None:
         """Redraws the parent ``Window`` and pauses for a short delay, to allow
@@ -98,19 +417,18 @@ class Maze:
         """
         if self._win is None:
             return
-        self._win.redraw()
-        sleep(1 / 25)
+        with self._phase("animate"):
+            self._win.redraw()
+            sleep(1 / 25)
 
     def _break_entrance_and_exit(self) -> None:
         """Break the entrance and exit walls. Entry is always the top wall of
         the top-left-most cell, and exit is always the bottom of the
         bottom-right-most cell.
         """
-        entry_cell = self._cells[0][0]
-        entry_cell.has_top_wall = False
+        self._grid.set_wall(0, TOP, False)
         self._draw_cell(0, 0)
-        exit_cell = self._cells[-1][-1]
-        exit_cell.has_bottom_wall = False
+        self._grid.set_wall(len(self._grid) - 1, BOTTOM, False)
         self._draw_cell(self._num_cols - 1, self._num_rows - 1)
 
     def _break_walls_r(self, i: int, j: int) -> None:
@@ -121,28 +439,21 @@ class Maze:
             i (int): X index of the current cell.
             j (int): Y index of the current cell.
         """
-        current_cell = self._cells[i][j]
-        current_cell.visited = True
+        grid = self._grid
+        index = grid.index(i, j)
+        grid.visited[index] = 1
+        if self._profiler is not None:
+            self._profiler.count("generate_cells_visited")
         while True:
             cells_to_visit = self._get_visitable_cells(i, j)
             if len(cells_to_visit) == 0:
                 self._draw_cell(i, j)
+                if self._profiler is not None:
+                    self._profiler.count("generate_backtracks")
                 break
-            direction, vi, vj = cells_to_visit[random.randrange(0, len(cells_to_visit))]
-            visit_cell = self._cells[vi][vj]
-            match direction:
-                case Direction.UP:
-                    current_cell.has_top_wall = False
-                    visit_cell.has_bottom_wall = False
-                case Direction.RIGHT:
-                    current_cell.has_right_wall = False
-                    visit_cell.has_left_wall = False
-                case Direction.DOWN:
-                    current_cell.has_bottom_wall = False
-                    visit_cell.has_top_wall = False
-                case Direction.LEFT:
-                    current_cell.has_left_wall = False
-                    visit_cell.has_right_wall = False
+            choice = self._rng.randrange(0, len(cells_to_visit))
+            direction, vi, vj = cells_to_visit[choice]
+            grid.carve(index, _direction_sides[direction][0])
             self._break_walls_r(vi, vj)
 
     def _get_visitable_cells(
@@ -166,6 +477,8 @@ class Maze:
             list[tuple[Direction, int, int]]: A list of visitable cells, along
             with the direction relative to the base cell.
         """
+        if self._profiler is not None:
+            self._profiler.count("get_visitable_cells_calls")
         last_col = self._num_cols - 1
         last_row = self._num_rows - 1
 
@@ -221,78 +534,405 @@ class Maze:
         if i > last_col or j > last_row or i < 0 or j < 0:
             raise ValueError(f"Invalid cell index provided: ({i}, {j})")
 
-        current_cell = self._cells[i][j]
-
         match direction:
             case Direction.UP:
                 if j <= 0:
                     return False
-                up_cell = self._cells[i][j - 1]
-                if up_cell.visited:
-                    return False
-                if ignore_walls:
-                    return True
-                if not current_cell.has_top_wall and not up_cell.has_bottom_wall:
-                    return True
-                else:
-                    return False
+                vi, vj = i, j - 1
             case Direction.RIGHT:
                 if i >= last_col:
                     return False
-                right_cell = self._cells[i + 1][j]
-                if right_cell.visited:
-                    return False
-                if ignore_walls:
-                    return True
-                if not current_cell.has_right_wall and not right_cell.has_left_wall:
-                    return True
-                else:
-                    return False
+                vi, vj = i + 1, j
             case Direction.DOWN:
                 if j >= last_row:
                     return False
-                down_cell = self._cells[i][j + 1]
-                if down_cell.visited:
-                    return False
-                if ignore_walls:
-                    return True
-                if not current_cell.has_bottom_wall and not down_cell.has_top_wall:
-                    return True
-                else:
-                    return False
+                vi, vj = i, j + 1
             case Direction.LEFT:
                 if i <= 0:
                     return False
-                left_cell = self._cells[i - 1][j]
-                if left_cell.visited:
-                    return False
-                if ignore_walls:
-                    return True
-                if not current_cell.has_left_wall and not left_cell.has_right_wall:
-                    return True
-                else:
-                    return False
+                vi, vj = i - 1, j
+
+        grid = self._grid
+        other = grid.index(vi, vj)
+        if grid.visited[other]:
+            return False
+        if ignore_walls:
+            return True
+        side, opposite = _direction_sides[direction]
+        passages = grid.passages
+        return bool(passages[grid.index(i, j)] & side and passages[other] & opposite)
 
     def _reset_cells_visited(self) -> None:
         """Reset the visited property of all cells to ``False``, to setup for
         maze solving.
         """
-        for col in self._cells:
-            for row in col:
-                row.visited = False
+        self._grid.reset_visited()
+
+    def generate_maze(
+        self,
+        algorithm: Algorithm = Algorithm.BACKTRACKER,
+        workers: int | None = None,
+        block_size: int = 128,
+        braid: float = 0.0,
+    ) -> None:
+        """Generate a perfect maze by breaking the entrance, exit and interior
+        walls, animating the process if a ``Window`` was provided. The maze can
+        then be braided, opening a wall out of some of its dead ends to add
+        loops.
+
+        Args:
+            algorithm (Algorithm, optional): The generation algorithm to use.
+            Defaults to ``Algorithm.BACKTRACKER``.
+            workers (int | None, optional): The number of worker processes used
+            by ``Algorithm.TILED``. If ``None``, one per CPU is used. Defaults
+            to None.
+            block_size (int, optional): The width and height of the blocks used
+            by ``Algorithm.TILED``. Defaults to 128.
+            braid (float, optional): The fraction of dead ends to remove, from
+            0 for a perfect maze to 1 for a maze without dead ends. Defaults to
+            0.
+
+        Raises:
+            ValueError: Raises ValueError if ``braid`` is not between 0 and 1.
+        """
+        if not 0 <= braid <= 1:
+            raise ValueError("Braid fraction must be between 0 and 1")
+        with self._phase("generate_maze"):
+            if self._load_cached(algorithm, block_size, braid):
+                return
+            self._break_entrance_and_exit()
+            match algorithm:
+                case Algorithm.BACKTRACKER:
+                    self._break_walls_r(0, 0)
+                case Algorithm.TILED:
+                    generate_tiled(
+                        self._grid, self._rng.getrandbits(64), block_size, workers
+                    )
+            redraw_all = (
+                algorithm is Algorithm.TILED
+                or self._render_mode is RenderMode.IMAGE
+            )
+            if braid > 0:
+                rng = random.Random(self._rng.getrandbits(64))
+                changed = braid_dead_ends(self._grid, braid, rng)
+                if not redraw_all:
+                    for index in changed:
+                        self._draw_cell(*self._grid.coordinates(index))
+            if redraw_all:
+                self._create_cells()
+            self._reset_cells_visited()
+            if self._cache_key is not None:
+                self._cache.put(self._cache_key, self._grid)
+                self._cache_version = self._grid.version
+
+    def _load_cached(self, algorithm: Algorithm, block_size: int, braid: float) -> bool:
+        """Loads the maze from the cache if it has already been generated with
+        the same parameters, and otherwise remembers the key to store it under.
+        Mazes without a seed are never cached.
+
+        Args:
+            algorithm (Algorithm): The generation algorithm.
+            block_size (int): The block size used by ``Algorithm.TILED``.
+            braid (float): The fraction of dead ends to remove.
 
-    def generate_maze(self) -> None:
-        self._break_entrance_and_exit()
-        self._break_walls_r(0, 0)
+        Returns:
+            bool: Whether the maze was loaded from the cache.
+        """
+        self._cache_key = None
+        if self._cache is None or self._seed is None:
+            return False
+        seed = self._seed
+        if isinstance(seed, (bytes, bytearray)):
+            seed = seed.hex()
+        self._cache_key = self._cache.key(
+            format=1,
+            rows=self._num_rows,
+            cols=self._num_cols,
+            seed=[type(seed).__name__, seed],
+            algorithm=algorithm.value,
+            block_size=block_size if algorithm is Algorithm.TILED else None,
+            braid=braid,
+        )
+        entry = self._read_cache()
+        if entry is None:
+            # The key describes the maze generated from a fresh seed, so start
+            # over even if this maze has been generated before.
+            self._rng.seed(self._seed)
+            return False
+        self._grid.passages[:] = entry.grid.passages
+        self._grid.version += 1
+        self._cache_version = self._grid.version
+        self._create_cells()
         self._reset_cells_visited()
+        return True
 
-    def solve(self) -> bool:
+    def _read_cache(self) -> CacheEntry | None:
+        """Reads this maze's entry from the cache. Entries for a grid of a
+        different size, such as a tampered file, are treated as missing.
+
+        Returns:
+            CacheEntry | None: The entry, or ``None`` if there is no usable
+            entry.
+        """
+        with self._phase("cache_read"):
+            entry = self._cache.get(self._cache_key)
+        if entry is None:
+            return None
+        if (entry.grid.num_cols, entry.grid.num_rows) != (
+            self._num_cols,
+            self._num_rows,
+        ):
+            return None
+        return entry
+
+    def solve(self, method: SolveMethod = SolveMethod.DFS) -> bool:
         """Animate solving the current maze.
 
+        Args:
+            method (SolveMethod, optional): The solving method to use. Defaults
+            to ``SolveMethod.DFS``.
+
         Returns:
             bool: Whether the maze was solved successfully or not.
         """
-        return self._solve_r(0, 0)
+        with self._phase("solve"):
+            match method:
+                case SolveMethod.DFS:
+                    return self._solve_r(0, 0)
+            return self._draw_path(self._shortest_path(method))
+
+    def _shortest_path(self, method: SolveMethod) -> list[int] | None:
+        """Finds a shortest path from the entrance to the exit.
+
+        Args:
+            method (SolveMethod): The solving method to use.
+
+        Raises:
+            ValueError: Raises ValueError if ``method`` is ``SolveMethod.DFS``,
+            which does not find shortest paths.
+
+        Returns:
+            list[int] | None: The grid indices of the cells along the path, or
+            ``None`` if the exit cannot be reached.
+        """
+        goal = len(self._grid) - 1
+        match method:
+            case SolveMethod.BFS:
+                return self._cached_shortest_path()
+            case SolveMethod.DIJKSTRA:
+                return cheapest_path(self._grid, 0, goal)
+            case SolveMethod.JUNCTION:
+                return self._junction_graph().shortest_path(0, goal)
+            case SolveMethod.INCREMENTAL:
+                return self._incremental_planner().shortest_path()
+        raise ValueError(f"{method} does not find shortest paths")
+
+    def _cached_shortest_path(self) -> list[int] | None:
+        """Finds a path with the fewest steps from the entrance to the exit,
+        reading it from or storing it in the cache if the walls are still as
+        they were generated.
+
+        Returns:
+            list[int] | None: The grid indices of the cells along the path, or
+            ``None`` if the exit cannot be reached.
+        """
+        grid = self._grid
+        cacheable = (
+            self._cache_key is not None and self._cache_version == grid.version
+        )
+        if cacheable:
+            entry = self._read_cache()
+            if entry is not None and entry.solution is not None:
+                return entry.solution
+        path = shortest_path(grid, 0, len(grid) - 1)
+        if cacheable and path is not None:
+            self._cache.put(self._cache_key, grid, path)
+        return path
+
+    def find_path(
+        self, method: SolveMethod = SolveMethod.BFS
+    ) -> list[tuple[int, int]] | None:
+        """Finds a shortest path from the entrance to the exit without
+        animating or marking any cells as visited.
+
+        Args:
+            method (SolveMethod, optional): The solving method to use. Defaults
+            to ``SolveMethod.BFS``.
+
+        Raises:
+            ValueError: Raises ValueError if ``method`` is ``SolveMethod.DFS``,
+            which does not find shortest paths.
+
+        Returns:
+            list[tuple[int, int]] | None: The column and row of each cell along
+            the path, or ``None`` if the exit cannot be reached.
+        """
+        with self._phase("find_path"):
+            path = self._shortest_path(method)
+        if path is None:
+            return None
+        return [self._grid.coordinates(index) for index in path]
+
+    def set_wall(self, i: int, j: int, direction: Direction, present: bool) -> None:
+        """Adds or removes the wall between a cell and its neighbor, updating
+        any incremental planner and redrawing both cells.
+
+        Args:
+            i (int): The column of the cell.
+            j (int): The row of the cell.
+            direction (Direction): The side of the cell the wall is on.
+            present (bool): Whether the wall should exist.
+
+        Raises:
+            ValueError: Raises ValueError if the cell is out of bounds, or the
+            wall is on the outer edge of the maze.
+        """
+        grid = self._grid
+        index = self._index(i, j)
+        side, opposite = _direction_sides[direction]
+        other = grid.neighbor(index, side)
+        if other is None:
+            raise ValueError(f"Cell ({i}, {j}) has no neighbor {direction}")
+        planner_current = (
+            self._planner is not None and self._planner.version == grid.version
+        )
+        grid.set_wall(index, side, present)
+        grid.set_wall(other, opposite, present)
+        if planner_current:
+            self._planner.update_cells((index, other))
+        if self._render_mode is RenderMode.IMAGE:
+            self._render_image()
+            self._animate()
+        else:
+            self._draw_cell(i, j, animate=False)
+            self._draw_cell(*grid.coordinates(other))
+
+    def set_cell_cost(self, i: int, j: int, cost: int) -> None:
+        """Sets the cost of stepping into a cell, updating any incremental
+        planner.
+
+        Args:
+            i (int): The column of the cell.
+            j (int): The row of the cell.
+            cost (int): The new cost of the cell, from 1 to 65535.
+
+        Raises:
+            ValueError: Raises ValueError if the cell is out of bounds or the
+            cost is out of range.
+        """
+        grid = self._grid
+        index = self._index(i, j)
+        planner_current = (
+            self._planner is not None
+            and self._planner.version == grid.version
+            and cost >= self._planner.min_cost
+        )
+        grid.set_cost(index, cost)
+        if planner_current:
+            self._planner.update_cells((index,))
+
+    def _incremental_planner(self) -> IncrementalPlanner:
+        """Returns the incremental planner of the maze, creating a new one if
+        the walls were changed without it being notified.
+
+        Returns:
+            IncrementalPlanner: The planner from the entrance to the exit.
+        """
+        grid = self._grid
+        if self._planner is None or self._planner.version != grid.version:
+            self._planner = IncrementalPlanner(grid, 0, len(grid) - 1)
+        return self._planner
+
+    def _junction_graph(self) -> JunctionGraph:
+        """Returns the junction graph of the maze, rebuilding it only if the
+        walls have changed since it was last built.
+
+        Returns:
+            JunctionGraph: The junction graph, with the entrance and exit cells
+            kept as nodes.
+        """
+        grid = self._grid
+        if self._junctions is None or self._junctions.version != grid.version:
+            with self._phase("build_junctions"):
+                self._junctions = JunctionGraph(grid, keep=(0, len(grid) - 1))
+        return self._junctions
+
+    def _draw_path(self, path: list[int] | None) -> bool:
+        """Marks the cells along a solved path as visited and animates the
+        moves along it.
+
+        Args:
+            path (list[int] | None): The grid indices of the cells along the
+            path, or ``None`` if no path was found.
+
+        Returns:
+            bool: Whether a path was given.
+        """
+        if path is None:
+            return False
+        grid = self._grid
+        for index in path:
+            grid.visited[index] = 1
+        if self._win is not None:
+            for index, next_index in zip(path, path[1:]):
+                i, j = grid.coordinates(index)
+                to_i, to_j = grid.coordinates(next_index)
+                self._draw_move(i, j, to_i, to_j)
+                self._animate()
+        return True
+
+    def analyze(self) -> MazeMetrics:
+        """Computes structural metrics of the maze, such as its solution
+        length, diameter and dead ends, without animating anything.
+
+        Returns:
+            MazeMetrics: The metrics of the maze.
+        """
+        with self._phase("analyze"):
+            return analyze(self._grid)
+
+    def distance_field(
+        self, sources: Iterable[tuple[int, int]] | None = None
+    ) -> array:
+        """Computes the number of steps from the nearest of the given cells to
+        every cell in the maze, in a single breadth-first pass.
+
+        Args:
+            sources (Iterable[tuple[int, int]] | None, optional): The column and
+            row of each cell to measure from. If ``None``, distances are
+            measured from the entrance. Defaults to None.
+
+        Raises:
+            ValueError: Raises ValueError if a source is out of bounds.
+
+        Returns:
+            array: The distance to each cell, indexed row-major as
+            ``row * num_cols + column``, with ``-1`` for unreachable cells.
+        """
+        if sources is None:
+            sources = [(0, 0)]
+        return distance_field(self._grid, [self._index(i, j) for i, j in sources])
+
+    def pack(self, solution: bool = False) -> bytes:
+        """Encodes the walls of the maze in the packed binary format of
+        ``WallGrid.pack``, optionally followed by a path with the fewest steps
+        from the entrance to the exit.
+
+        Args:
+            solution (bool, optional): Whether to append the solution, as the
+            little-endian 64-bit grid index of each cell along it. Nothing is
+            appended if the exit cannot be reached. Defaults to False.
+
+        Returns:
+            bytes: The encoded maze, readable with ``cache.decode_entry``.
+        """
+        from cache import encode_entry
+
+        path = None
+        if solution:
+            with self._phase("find_path"):
+                path = self._cached_shortest_path()
+        return encode_entry(self._grid, path)
 
     def _solve_r(self, i: int, j: int) -> bool:
         """Recursively animate solving the current maze. Try each direction in
@@ -307,20 +947,23 @@ class Maze:
         Returns:
             bool: Whether this cell was on a successful path
         """
-        current_cell = self._cells[i][j]
-        current_cell.visited = True
+        grid = self._grid
+        grid.visited[grid.index(i, j)] = 1
+        if self._profiler is not None:
+            self._profiler.count("solve_cells_visited")
         self._animate()
         if i == self._num_cols - 1 and j == self._num_rows - 1:
             return True
 
         visitable_cells = self._get_visitable_cells(i, j, False)
         for _, vi, vj in visitable_cells:
-            visitable_cell = self._cells[vi][vj]
-            if visitable_cell.visited:
+            if grid.visited[grid.index(vi, vj)]:
                 continue
-            current_cell.draw_move(visitable_cell)
+            self._draw_move(i, j, vi, vj)
             if self._solve_r(vi, vj):
                 return True
-            current_cell.draw_move(visitable_cell, True)
+            self._draw_move(i, j, vi, vj, True)
+            if self._profiler is not None:
+                self._profiler.count("solve_backtracks")
 
         return False
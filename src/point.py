@@ -1,6 +1,10 @@
-from typing_extensions import Self
+from __future__ import annotations
 from collections.abc import Iterable
 from itertools import islice
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
 
 
 class Point:
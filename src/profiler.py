@@ -0,0 +1,70 @@
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from time import perf_counter
+
+
+class Profiler:
+    """Collects counters and phase timings from a ``Maze`` and its ``Window``.
+
+    A profiler is entirely opt-in: when none is attached, the instrumented code
+    paths only pay for a single ``None`` check.
+
+    Attributes:
+        counters (defaultdict[str, int]): Event counts keyed by counter name.
+        timings (defaultdict[str, float]): Total seconds spent in each phase.
+        calls (defaultdict[str, int]): Number of times each phase was entered.
+    """
+
+    def __init__(self) -> None:
+        """Creates a new profiler with all counters and timings at zero."""
+        self.counters: defaultdict[str, int] = defaultdict(int)
+        self.timings: defaultdict[str, float] = defaultdict(float)
+        self.calls: defaultdict[str, int] = defaultdict(int)
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """Increments the named counter.
+
+        Args:
+            name (str): The counter to increment.
+            amount (int, optional): How much to add. Defaults to 1.
+        """
+        self.counters[name] += amount
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Times the body of a ``with`` block and adds it to the named phase.
+        Phases may be nested, in which case the inner time is also included in
+        the outer phase.
+
+        Args:
+            name (str): The phase being timed.
+        """
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] += perf_counter() - start
+            self.calls[name] += 1
+
+    def reset(self) -> None:
+        """Clears all counters and timings."""
+        self.counters.clear()
+        self.timings.clear()
+        self.calls.clear()
+
+    def report(self) -> dict[str, dict]:
+        """Builds a snapshot of everything recorded so far.
+
+        Returns:
+            dict[str, dict]: A dictionary with a ``"counters"`` entry mapping
+            counter names to counts, and a ``"phases"`` entry mapping phase
+            names to a dictionary of ``"calls"`` and ``"seconds"``.
+        """
+        return {
+            "counters": dict(self.counters),
+            "phases": {
+                name: {"calls": self.calls[name], "seconds": seconds}
+                for name, seconds in self.timings.items()
+            },
+        }
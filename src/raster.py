@@ -0,0 +1,82 @@
+from grid import WallGrid, TOP, RIGHT, BOTTOM, LEFT
+
+# Match the colors ``Cell.draw`` uses for walls and for absent walls.
+_wall_rgb = bytes((0x00, 0x00, 0x00))
+_absent_rgb = bytes((0xD9, 0xD9, 0xD9))
+
+
+def _paint(scanline: bytearray, start: int, end: int) -> None:
+    """Paints a horizontal run of wall pixels onto a scanline.
+
+    Args:
+        scanline (bytearray): The RGB scanline to paint onto.
+        start (int): The first pixel of the run.
+        end (int): The pixel after the last pixel of the run.
+    """
+    scanline[start * 3 : end * 3] = _wall_rgb * (end - start)
+
+
+def rasterize(
+    grid: WallGrid, cell_width: int, cell_height: int, line_width: int = 2
+) -> bytes:
+    """Renders the walls of a grid into a binary PPM image in bulk. Each
+    distinct scanline is built once and then copied to every pixel row it
+    covers, so the per-pixel work happens in byte copies rather than Python.
+
+    The wall between two cells is centered on their shared edge, so the image
+    extends ``line_width // 2`` pixels up and to the left of the first cell.
+
+    Args:
+        grid (WallGrid): The grid to render.
+        cell_width (int): The number of pixels wide each cell is.
+        cell_height (int): The number of pixels high each cell is.
+        line_width (int, optional): The thickness of the walls in pixels.
+        Defaults to 2.
+
+    Returns:
+        bytes: The image, in binary PPM format.
+    """
+    num_cols = grid.num_cols
+    num_rows = grid.num_rows
+    passages = grid.passages
+    width = num_cols * cell_width + line_width
+    height = num_rows * cell_height + line_width
+    row_bytes = width * 3
+    blank = _absent_rgb * width
+
+    def vertical_walls(scanline: bytearray, j: int) -> None:
+        """Paints the vertical walls of row ``j`` onto a scanline."""
+        row_start = j * num_cols
+        for i in range(num_cols + 1):
+            left_open = i == 0 or passages[row_start + i - 1] & RIGHT
+            right_open = i == num_cols or passages[row_start + i] & LEFT
+            if not (left_open and right_open):
+                x = i * cell_width
+                _paint(scanline, x, x + line_width)
+
+    pixels = bytearray(row_bytes * height)
+    for j in range(num_rows + 1):
+        # The scanline through the edge between rows j - 1 and j, which also
+        # carries the vertical walls of both rows so corners are joined.
+        edge = bytearray(blank)
+        if j > 0:
+            vertical_walls(edge, j - 1)
+        if j < num_rows:
+            vertical_walls(edge, j)
+        for i in range(num_cols):
+            above_open = j == 0 or passages[(j - 1) * num_cols + i] & BOTTOM
+            below_open = j == num_rows or passages[j * num_cols + i] & TOP
+            if not (above_open and below_open):
+                x = i * cell_width
+                _paint(edge, x, x + cell_width + line_width)
+        y = j * cell_height
+        for row in range(y, y + line_width):
+            pixels[row * row_bytes : (row + 1) * row_bytes] = edge
+
+        if j < num_rows:
+            interior = bytearray(blank)
+            vertical_walls(interior, j)
+            for row in range(y + line_width, y + cell_height):
+                pixels[row * row_bytes : (row + 1) * row_bytes] = interior
+
+    return b"P6\n%d %d\n255\n" % (width, height) + pixels
@@ -0,0 +1,211 @@
+from array import array
+from collections.abc import Iterable
+from grid import WallGrid, TOP, RIGHT, BOTTOM, LEFT
+
+UNREACHED = -1
+
+
+def distance_field(
+    grid: WallGrid, sources: Iterable[int], target: int | None = None
+) -> array:
+    """Computes the number of steps from the nearest source to every cell with
+    a level-synchronous breadth-first search. All sources start in the first
+    frontier, so any number of sources costs a single pass over the grid.
+
+    Args:
+        grid (WallGrid): The grid to search.
+        sources (Iterable[int]): The indices of the cells to measure from.
+        target (int | None, optional): If given, the search stops as soon as
+        this cell is reached, leaving cells further away unreached. Defaults
+        to None.
+
+    Raises:
+        ValueError: Raises ValueError if no sources are given, or a source is
+        out of range.
+
+    Returns:
+        array: A signed integer array indexed like ``grid.passages`` holding
+        each cell's distance, or ``UNREACHED`` if it cannot be reached.
+    """
+    num_cells = len(grid)
+    num_cols = grid.num_cols
+    last_row_start = num_cells - num_cols
+    passages = grid.passages
+    distances = array("l", [UNREACHED]) * num_cells
+
+    frontier = []
+    for source in sources:
+        if source < 0 or source >= num_cells:
+            raise ValueError(f"Invalid source cell: {source}")
+        if distances[source] == UNREACHED:
+            distances[source] = 0
+            frontier.append(source)
+    if not frontier:
+        raise ValueError("At least one source cell is required")
+
+    level = 0
+    while frontier:
+        if target is not None and distances[target] != UNREACHED:
+            break
+        level += 1
+        next_frontier = []
+        append = next_frontier.append
+        for index in frontier:
+            open_sides = passages[index]
+            if not open_sides:
+                continue
+            col = index % num_cols
+            if open_sides & TOP and index >= num_cols:
+                other = index - num_cols
+                if distances[other] == UNREACHED:
+                    distances[other] = level
+                    append(other)
+            if open_sides & RIGHT and col != num_cols - 1:
+                other = index + 1
+                if distances[other] == UNREACHED:
+                    distances[other] = level
+                    append(other)
+            if open_sides & BOTTOM and index < last_row_start:
+                other = index + num_cols
+                if distances[other] == UNREACHED:
+                    distances[other] = level
+                    append(other)
+            if open_sides & LEFT and col != 0:
+                other = index - 1
+                if distances[other] == UNREACHED:
+                    distances[other] = level
+                    append(other)
+        frontier = next_frontier
+    return distances
+
+
+def shortest_path(grid: WallGrid, start: int, goal: int) -> list[int] | None:
+    """Finds a shortest path between two cells. Distances are measured from the
+    goal, so the path can be read off by stepping downhill from the start
+    without storing a parent for every cell.
+
+    Args:
+        grid (WallGrid): The grid to search.
+        start (int): The index of the first cell of the path.
+        goal (int): The index of the last cell of the path.
+
+    Returns:
+        list[int] | None: The indices of the cells along the path, including
+        both ends, or ``None`` if the goal cannot be reached.
+    """
+    distances = distance_field(grid, [goal], target=start)
+    if distances[start] == UNREACHED:
+        return None
+    path = [start]
+    index = start
+    while index != goal:
+        remaining = distances[index] - 1
+        for other in grid.open_neighbors(index):
+            if distances[other] == remaining:
+                index = other
+                break
+        path.append(index)
+    return path
+
+
+def cheapest_path(
+    grid: WallGrid, start: int, goal: int, use_heuristic: bool = True
+) -> list[int] | None:
+    """Finds a cheapest path between two cells, where stepping into a cell
+    costs ``WallGrid.cost``. Uses Dijkstra's algorithm, or A* with a Manhattan
+    distance heuristic, on a monotone bucket queue. Since cell costs are small
+    integers, every queued priority lies within a fixed window above the
+    current one, so a ring of buckets replaces the binary heap and each push
+    and pop takes constant time.
+
+    Args:
+        grid (WallGrid): The grid to search.
+        start (int): The index of the first cell of the path.
+        goal (int): The index of the last cell of the path.
+        use_heuristic (bool, optional): Whether to search with A* rather than
+        plain Dijkstra. Defaults to True.
+
+    Returns:
+        list[int] | None: The indices of the cells along the path, including
+        both ends, or ``None`` if the goal cannot be reached.
+    """
+    num_cells = len(grid)
+    num_cols = grid.num_cols
+    last_row_start = num_cells - num_cols
+    passages = grid.passages
+    costs = grid.costs
+    min_cost, max_cost = grid.cost_range()
+    goal_j, goal_i = divmod(goal, num_cols)
+    scale = min_cost if use_heuristic else 0
+
+    def heuristic(index: int) -> int:
+        """Returns a lower bound on the cost from a cell to the goal."""
+        j, i = divmod(index, num_cols)
+        return (abs(i - goal_i) + abs(j - goal_j)) * scale
+
+    # A priority never exceeds the one being expanded by more than the cost of
+    # a step plus the drop in the heuristic, which is at most one cell's worth.
+    num_buckets = max_cost + scale + 1
+    buckets: list[list[int]] = [[] for _ in range(num_buckets)]
+    distances = array("q", [UNREACHED]) * num_cells
+    parents = array("q", [UNREACHED]) * num_cells
+    settled = bytearray(num_cells)
+
+    distances[start] = 0
+    priority = heuristic(start)
+    buckets[priority % num_buckets].append(start)
+    queued = 1
+    while queued:
+        bucket = buckets[priority % num_buckets]
+        if not bucket:
+            priority += 1
+            continue
+        index = bucket.pop()
+        queued -= 1
+        if settled[index] or distances[index] + heuristic(index) != priority:
+            continue
+        if index == goal:
+            break
+        settled[index] = 1
+        distance = distances[index]
+        open_sides = passages[index]
+        col = index % num_cols
+        for side, other, exists in (
+            (TOP, index - num_cols, index >= num_cols),
+            (RIGHT, index + 1, col != num_cols - 1),
+            (BOTTOM, index + num_cols, index < last_row_start),
+            (LEFT, index - 1, col != 0),
+        ):
+            if not open_sides & side or not exists or settled[other]:
+                continue
+            candidate = distance + (1 if costs is None else costs[other])
+            if distances[other] == UNREACHED or candidate < distances[other]:
+                distances[other] = candidate
+                parents[other] = index
+                other_priority = candidate + heuristic(other)
+                buckets[other_priority % num_buckets].append(other)
+                queued += 1
+
+    if distances[goal] == UNREACHED:
+        return None
+    path = [goal]
+    index = goal
+    while index != start:
+        index = parents[index]
+        path.append(index)
+    path.reverse()
+    return path
+
+
+def path_cost(grid: WallGrid, path: list[int]) -> int:
+    """Returns the total cost of a path, which is the cost of every cell
+    stepped into after the first.
+
+    Args:
+        grid (WallGrid): The grid the path is in.
+        path (list[int]): The indices of the cells along the path.
+
+    Returns:
+        int: The cost of the path.
+    """
+    return sum(grid.cost(index) for index in path[1:])
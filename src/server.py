@@ -0,0 +1,382 @@
+from __future__ import annotations
+import argparse
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import partial
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING
+from urllib.parse import parse_qs, urlsplit
+from cache import MazeCache
+from maze import Maze, Algorithm
+from profiler import Profiler
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+# The rows, columns, seed, algorithm, block size, braid fraction and whether to
+# include the solution of a requested maze.
+MazeRequest = tuple[int, int, int | None, str, int, float, bool]
+
+# The recursive backtracker recurses once per step of its longest path, which
+# may visit every cell, so larger mazes would exceed the recursion limit.
+MAX_BACKTRACKER_CELLS = 900
+
+_true_values = ("1", "true", "yes")
+_false_values = ("0", "false", "no")
+
+
+def parse_request(query: str, max_cells: int) -> MazeRequest:
+    """Parses and validates the query string of a request for a maze.
+
+    The query takes ``rows`` and ``cols``, which are required, and optionally
+    ``seed``, ``algorithm`` (``tiled`` by default, as the recursive backtracker
+    is limited to ``MAX_BACKTRACKER_CELLS`` cells), ``block_size``, ``braid``
+    and ``solve``.
+
+    Args:
+        query (str): The query string, without the leading ``?``.
+        max_cells (int): The largest maze that may be requested.
+
+    Raises:
+        ValueError: Raises ValueError if a parameter is missing, malformed or
+        out of range.
+
+    Returns:
+        MazeRequest: The parsed request.
+    """
+    params = {name: values[-1] for name, values in parse_qs(query).items()}
+    unknown = params.keys() - {
+        "rows",
+        "cols",
+        "seed",
+        "algorithm",
+        "block_size",
+        "braid",
+        "solve",
+    }
+    if unknown:
+        raise ValueError(f"Unknown parameter: {sorted(unknown)[0]}")
+    try:
+        rows = int(params["rows"])
+        cols = int(params["cols"])
+        seed = int(params["seed"]) if "seed" in params else None
+        algorithm = Algorithm(params.get("algorithm", "tiled").upper())
+        block_size = int(params.get("block_size", 128))
+        braid = float(params.get("braid", 0))
+    except KeyError as error:
+        raise ValueError(f"Missing parameter: {error.args[0]}") from None
+    solve = params.get("solve", "0").lower()
+    if solve not in _true_values + _false_values:
+        raise ValueError("solve must be a boolean")
+    if rows <= 0 or cols <= 0:
+        raise ValueError("Mazes must have at least 1 row and 1 column")
+    if rows * cols > max_cells:
+        raise ValueError(f"Mazes may have at most {max_cells} cells")
+    if algorithm is Algorithm.BACKTRACKER and rows * cols > MAX_BACKTRACKER_CELLS:
+        raise ValueError(
+            f"Backtracker mazes may have at most {MAX_BACKTRACKER_CELLS} cells;"
+            " use algorithm=tiled for larger mazes"
+        )
+    if block_size <= 0:
+        raise ValueError("Blocks must be at least 1 cell wide and 1 cell tall")
+    if not 0 <= braid <= 1:
+        raise ValueError("Braid fraction must be between 0 and 1")
+    return (
+        rows,
+        cols,
+        seed,
+        algorithm.value,
+        block_size,
+        braid,
+        solve in _true_values,
+    )
+
+
+def _build_batch(
+    requests: list[MazeRequest], cache_directory: str | None
+) -> list[bytes | Exception]:
+    """Worker entry point that generates a batch of mazes.
+
+    Args:
+        requests (list[MazeRequest]): The mazes to generate.
+        cache_directory (str | None): The directory of a ``MazeCache`` to share
+        between the workers, if any.
+
+    Returns:
+        list[bytes | Exception]: The packed maze for each request, or the
+        exception raised while generating it.
+    """
+    cache = MazeCache(cache_directory) if cache_directory is not None else None
+    results = []
+    for rows, cols, seed, algorithm, block_size, braid, solve in requests:
+        try:
+            maze = Maze(0, 0, rows, cols, 1, 1, seed=seed, cache=cache)
+            maze.generate_maze(
+                Algorithm(algorithm), workers=1, block_size=block_size, braid=braid
+            )
+            results.append(maze.pack(solution=solve))
+        except Exception as error:
+            results.append(error)
+    return results
+
+
+def _ready() -> None:
+    """Worker entry point used to start the workers ahead of the first batch."""
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Serves ``GET /maze`` requests from a ``MazeService``."""
+
+    # Keep connections open so clients can reuse them across requests.
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        """Responds with the requested maze, packed as by ``Maze.pack``."""
+        service = self.server.service
+        url = urlsplit(self.path)
+        if url.path != "/maze":
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+        try:
+            request = parse_request(url.query, service.max_cells)
+        except ValueError as error:
+            self.send_error(HTTPStatus.BAD_REQUEST, str(error))
+            return
+        try:
+            data = service.submit(request).result()
+        except Exception as error:
+            self.send_error(HTTPStatus.INTERNAL_SERVER_ERROR, repr(error))
+            return
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args: object) -> None:
+        """Silences the per-request log lines."""
+
+
+class MazeService:
+    """A local HTTP service that generates and solves mazes in a warm pool of
+    worker processes.
+
+    Requests that arrive within ``batch_window`` seconds of each other are
+    gathered into a batch and split evenly across the workers, so each worker
+    receives one task per batch rather than one per request. Concurrent
+    requests for the same seeded maze are only generated once. Responses are
+    the packed walls of the maze, optionally followed by its solution, and can
+    be read with ``cache.decode_entry``.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        workers: int | None = None,
+        cache_directory: str | None = None,
+        batch_window: float = 0.002,
+        max_cells: int = 16 * 1024 * 1024,
+        profiler: Profiler | None = None,
+    ) -> None:
+        """Starts the worker pool and binds the HTTP server. Call
+        ``serve_forever`` or ``start`` to begin handling requests.
+
+        Args:
+            host (str, optional): The address to listen on. Defaults to
+            ``"127.0.0.1"``.
+            port (int, optional): The port to listen on, or 0 to pick a free
+            one. Defaults to 0.
+            workers (int | None, optional): The number of worker processes. If
+            ``None``, one per CPU is used. Defaults to None.
+            cache_directory (str | None, optional): The directory of a
+            ``MazeCache`` shared by the workers, if any. Defaults to None.
+            batch_window (float, optional): How many seconds to wait for more
+            requests to join a batch. Defaults to 0.002.
+            max_cells (int, optional): The largest maze that may be requested.
+            Defaults to 16Mi cells.
+            profiler (Profiler | None, optional): Counts requests, batches and
+            deduplicated requests if provided. Defaults to None.
+
+        Raises:
+            ValueError: Raises ValueError if ``workers`` is not at least 1.
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers <= 0:
+            raise ValueError("At least 1 worker is required")
+        self.max_cells = max_cells
+        self._workers = workers
+        self._cache_directory = cache_directory
+        self._batch_window = batch_window
+        self._profiler = profiler
+        self._condition = threading.Condition()
+        self._futures: dict[object, Future] = {}
+        self._queue: list[tuple[object, MazeRequest]] = []
+        self._closed = False
+        # Spawn rather than fork, as the process already runs several threads.
+        self._executor = ProcessPoolExecutor(
+            workers, mp_context=multiprocessing.get_context("spawn")
+        )
+        for _ in range(workers):
+            self._executor.submit(_ready)
+        self._server = ThreadingHTTPServer((host, port), _Handler)
+        self._server.daemon_threads = True
+        self._server.service = self
+        self._dispatcher = threading.Thread(target=self._dispatch, daemon=True)
+        self._dispatcher.start()
+        self._serving: threading.Thread | None = None
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """tuple[str, int]: The host and port the service is listening on."""
+        host, port = self._server.server_address[:2]
+        return host, port
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        """Increments a profiler counter, if a profiler is attached.
+
+        Args:
+            name (str): The counter to increment.
+            amount (int, optional): How much to add. Defaults to 1.
+        """
+        if self._profiler is not None:
+            self._profiler.count(name, amount)
+
+    def submit(self, request: MazeRequest) -> Future:
+        """Queues a maze for the next batch, or joins an identical request
+        that is already queued or being generated. Requests without a seed are
+        never merged, as each should produce a different maze.
+
+        Args:
+            request (MazeRequest): The maze to generate, as returned by
+            ``parse_request``.
+
+        Raises:
+            RuntimeError: Raises RuntimeError if the service has been closed.
+
+        Returns:
+            Future: Resolves to the packed maze.
+        """
+        key = request if request[2] is not None else object()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("The maze service has been closed")
+            self._count("service_requests")
+            future = self._futures.get(key)
+            if future is not None:
+                self._count("service_deduplicated")
+                return future
+            future = self._futures[key] = Future()
+            self._queue.append((key, request))
+            self._condition.notify()
+            return future
+
+    def _dispatch(self) -> None:
+        """Dispatcher thread that sends queued requests to the workers in
+        batches until the service is closed and the queue is empty.
+        """
+        while True:
+            with self._condition:
+                while not self._queue and not self._closed:
+                    self._condition.wait()
+                if not self._queue:
+                    return
+            # Give concurrent requests a moment to join the batch.
+            time.sleep(self._batch_window)
+            with self._condition:
+                batch, self._queue = self._queue, []
+                self._count("service_batches")
+            num_chunks = min(self._workers, len(batch))
+            for chunk in (batch[start::num_chunks] for start in range(num_chunks)):
+                task = self._executor.submit(
+                    _build_batch,
+                    [request for _, request in chunk],
+                    self._cache_directory,
+                )
+                task.add_done_callback(partial(self._resolve, chunk))
+
+    def _resolve(self, chunk: list[tuple[object, MazeRequest]], task: Future) -> None:
+        """Completes the requests of a finished worker task.
+
+        Args:
+            chunk (list[tuple[object, MazeRequest]]): The keys and requests
+            that were sent to the worker.
+            task (Future): The worker task.
+        """
+        try:
+            results = task.result()
+        except Exception as error:
+            results = [error] * len(chunk)
+        with self._condition:
+            futures = [self._futures.pop(key) for key, _ in chunk]
+        for future, result in zip(futures, results):
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def serve_forever(self) -> None:
+        """Handles requests on the current thread until interrupted."""
+        self._server.serve_forever()
+
+    def start(self) -> None:
+        """Handles requests on a background thread until ``close`` is called."""
+        self._serving = threading.Thread(target=self.serve_forever, daemon=True)
+        self._serving.start()
+
+    def close(self) -> None:
+        """Stops accepting requests, finishes any that are queued or being
+        generated, and shuts down the worker pool.
+        """
+        if self._serving is not None:
+            self._server.shutdown()
+            self._serving.join()
+        self._server.server_close()
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._dispatcher.join()
+        self._executor.shutdown()
+
+    def __enter__(self) -> Self:
+        """Returns the service for use in a ``with`` block.
+
+        Returns:
+            Self: This service.
+        """
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Closes the service at the end of a ``with`` block.
+
+        Args:
+            *exc_info (object): The exception raised in the block, if any.
+        """
+        self.close()
+
+
+def main() -> None:
+    """Runs the service from the command line until interrupted."""
+    parser = argparse.ArgumentParser(description="Serve mazes over local HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--cache", help="directory to cache generated mazes in")
+    args = parser.parse_args()
+
+    with MazeService(args.host, args.port, args.workers, args.cache) as service:
+        host, port = service.address
+        print(f"Serving mazes on http://{host}:{port}/maze")
+        try:
+            service.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+import unittest
+from collections import Counter
+from grid import WallGrid, TOP, RIGHT, BOTTOM
+from analysis import analyze
+from tiling import generate_tiled
+
+
+def junction_grid() -> WallGrid:
+    # 0 - 1 - 2
+    #     |
+    # 3 - 4 - 5
+    grid = WallGrid(3, 2)
+    grid.set_wall(0, TOP, False)
+    grid.set_wall(5, BOTTOM, False)
+    grid.carve(0, RIGHT)
+    grid.carve(1, RIGHT)
+    grid.carve(1, BOTTOM)
+    grid.carve(3, RIGHT)
+    grid.carve(4, RIGHT)
+    return grid
+
+
+class TestAnalysis(unittest.TestCase):
+    def test_analyze(self):
+        metrics = analyze(junction_grid())
+        self.assertEqual(list(metrics.distances), [0, 1, 2, 3, 2, 3])
+        self.assertEqual(metrics.solution_length, 3)
+        self.assertEqual(metrics.diameter, 3)
+        self.assertEqual(metrics.dead_ends, 4)
+        self.assertEqual(metrics.junctions, 2)
+        self.assertEqual(metrics.corridor_lengths, Counter({1: 5}))
+        self.assertEqual(metrics.branching_factor, 3.0)
+
+    def test_analyze_corridor(self):
+        grid = WallGrid(4, 1)
+        for index in range(3):
+            grid.carve(index, RIGHT)
+        metrics = analyze(grid)
+        self.assertEqual(metrics.diameter, 3)
+        self.assertEqual(set(metrics.diameter_endpoints), {0, 3})
+        self.assertEqual(metrics.corridor_lengths, Counter({3: 1}))
+        self.assertEqual(metrics.junctions, 0)
+        self.assertEqual(metrics.branching_factor, 0.0)
+
+    def test_analyze_generated(self):
+        grid = WallGrid(30, 20)
+        generate_tiled(grid, 0, block_size=8, workers=1)
+        metrics = analyze(grid)
+        corridors = metrics.corridor_lengths.items()
+        steps = sum(length * count for length, count in corridors)
+        self.assertEqual(steps, len(grid) - 1)
+        self.assertGreaterEqual(metrics.diameter, metrics.solution_length)
+
+
+if __name__ == "__main__":
+    unittest.main()
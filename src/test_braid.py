@@ -0,0 +1,50 @@
+import random
+import unittest
+from grid import WallGrid
+from braid import braid
+from search import distance_field
+from tiling import generate_tiled
+
+
+def generated_grid() -> WallGrid:
+    grid = WallGrid(30, 20)
+    generate_tiled(grid, 0, block_size=8, workers=1)
+    return grid
+
+
+class TestBraid(unittest.TestCase):
+    def test_braid_none(self):
+        grid = generated_grid()
+        passages = bytearray(grid.passages)
+        self.assertEqual(braid(grid, 0, random.Random(0)), [])
+        self.assertEqual(grid.passages, passages)
+
+    def test_braid_all(self):
+        grid = generated_grid()
+        braid(grid, 1, random.Random(0))
+        self.assertEqual(grid.degrees().count(1), 0)
+
+    def test_braid_partial(self):
+        grid = generated_grid()
+        dead_ends = grid.degrees().count(1)
+        changed = braid(grid, 0.5, random.Random(0))
+        self.assertGreater(len(changed), 0)
+        self.assertGreater(grid.degrees().count(1), 0)
+        self.assertLess(grid.degrees().count(1), dead_ends)
+
+    def test_braid_keeps_connected(self):
+        grid = generated_grid()
+        braid(grid, 1, random.Random(0))
+        self.assertNotIn(-1, distance_field(grid, [0]))
+
+    def test_braid_corridor(self):
+        grid = WallGrid(3, 1)
+        generate_tiled(grid, 0, workers=1)
+        self.assertEqual(braid(grid, 1, random.Random(0)), [])
+
+    def test_braid_invalid_fraction(self):
+        self.assertRaises(ValueError, braid, generated_grid(), 1.5, random.Random(0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import os
+import tempfile
+import unittest
+from cache import MazeCache, decode_entry, encode_entry
+from grid import WallGrid, RIGHT, BOTTOM, packed_size
+
+
+class TestMazeCache(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.cache = MazeCache(self._tmp.name)
+
+    def _grid(self):
+        grid = WallGrid(3, 2)
+        grid.carve(0, RIGHT)
+        grid.carve(1, BOTTOM)
+        return grid
+
+    def test_key_deterministic(self):
+        key = MazeCache.key(rows=2, cols=3, seed=1)
+        self.assertEqual(key, MazeCache.key(seed=1, cols=3, rows=2))
+        self.assertNotEqual(key, MazeCache.key(rows=2, cols=3, seed=2))
+
+    def test_get_missing(self):
+        self.assertIsNone(self.cache.get(MazeCache.key(seed=0)))
+
+    def test_put_get(self):
+        key = MazeCache.key(seed=0)
+        grid = self._grid()
+        self.cache.put(key, grid)
+        entry = self.cache.get(key)
+        self.assertEqual(entry.grid.passages, grid.passages)
+        self.assertIsNone(entry.solution)
+
+    def test_put_get_solution(self):
+        key = MazeCache.key(seed=0)
+        self.cache.put(key, self._grid(), [0, 1, 4])
+        self.assertEqual(self.cache.get(key).solution, [0, 1, 4])
+
+    def test_put_replaces(self):
+        key = MazeCache.key(seed=0)
+        self.cache.put(key, WallGrid(3, 2))
+        self.cache.put(key, self._grid())
+        self.assertEqual(self.cache.get(key).grid.passages, self._grid().passages)
+
+    def test_no_temporary_files_left(self):
+        self.cache.put(MazeCache.key(seed=0), self._grid())
+        self.assertEqual(
+            [name for name in os.listdir(self._tmp.name) if name.startswith(".")],
+            [],
+        )
+
+    def test_corrupt_entry(self):
+        key = MazeCache.key(seed=0)
+        self.cache.put(key, self._grid())
+        with open(os.path.join(self._tmp.name, key + ".maze"), "wb") as file:
+            file.write(b"junk")
+        self.assertIsNone(self.cache.get(key))
+
+    def test_evicts_least_recently_used(self):
+        size = packed_size(3, 2)
+        cache = MazeCache(self._tmp.name, max_bytes=size * 2)
+        keys = [MazeCache.key(seed=seed) for seed in range(3)]
+        cache.put(keys[0], self._grid())
+        cache.put(keys[1], self._grid())
+        for age, key in enumerate(keys[:2]):
+            path = os.path.join(self._tmp.name, key + ".maze")
+            os.utime(path, (age, age))
+        cache.get(keys[0])
+        cache.put(keys[2], self._grid())
+        self.assertIsNotNone(cache.get(keys[0]))
+        self.assertIsNone(cache.get(keys[1]))
+        self.assertIsNotNone(cache.get(keys[2]))
+
+    def test_encode_decode(self):
+        data = encode_entry(self._grid(), [0, 1])
+        entry = decode_entry(data)
+        self.assertEqual(entry.grid.passages, self._grid().passages)
+        self.assertEqual(entry.solution, [0, 1])
+        self.assertRaises(ValueError, decode_entry, data[:-1])
+
+    def test_clear(self):
+        key = MazeCache.key(seed=0)
+        self.cache.put(key, self._grid())
+        self.cache.clear()
+        self.assertIsNone(self.cache.get(key))
+
+    def test_negative_size(self):
+        self.assertRaises(ValueError, MazeCache, self._tmp.name, -1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import os
+import tempfile
+import unittest
+from external import solve_file
+from grid import WallGrid, RIGHT, BOTTOM
+from search import shortest_path
+from tiling import generate_tiled
+
+
+class TestSolveFile(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+
+    def _save(self, grid):
+        path = os.path.join(self._tmp.name, "maze.bin")
+        with open(path, "wb") as file:
+            file.write(grid.pack())
+        return path
+
+    def test_matches_in_memory_search(self):
+        grid = WallGrid(37, 23)
+        generate_tiled(grid, 5, block_size=8, workers=1)
+        path = self._save(grid)
+        expected = shortest_path(grid, 0, len(grid) - 1)
+        self.assertEqual(len(solve_file(path)), len(expected))
+        self.assertEqual(solve_file(path), expected)
+
+    def test_spills_frontier(self):
+        grid = WallGrid(20, 20)
+        for index in range(len(grid)):
+            col, row = grid.coordinates(index)
+            if col < 19:
+                grid.carve(index, RIGHT)
+            if row < 19:
+                grid.carve(index, BOTTOM)
+        path = self._save(grid)
+        result = solve_file(path, frontier_limit=2, spill_directory=self._tmp.name)
+        self.assertEqual(len(result), 39)
+        self.assertEqual((result[0], result[-1]), (0, 399))
+        for index, next_index in zip(result, result[1:]):
+            self.assertIn(next_index, grid.open_neighbors(index))
+        self.assertEqual(os.listdir(self._tmp.name), ["maze.bin"])
+
+    def test_start_and_goal(self):
+        grid = WallGrid(3, 1)
+        grid.carve(0, RIGHT)
+        grid.carve(1, RIGHT)
+        path = self._save(grid)
+        self.assertEqual(solve_file(path, start=2, goal=0), [2, 1, 0])
+        self.assertEqual(solve_file(path, start=1, goal=1), [1])
+
+    def test_unreachable(self):
+        grid = WallGrid(3, 1)
+        grid.carve(0, RIGHT)
+        self.assertIsNone(solve_file(self._save(grid)))
+
+    def test_invalid(self):
+        path = self._save(WallGrid(3, 1))
+        self.assertRaises(ValueError, solve_file, path, goal=3)
+        self.assertRaises(ValueError, solve_file, path, frontier_limit=0)
+        with open(path, "wb") as file:
+            file.write(b"junk" * 8)
+        self.assertRaises(ValueError, solve_file, path)
+
+
+if __name__ == "__main__":
+    unittest.main()
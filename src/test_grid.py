@@ -0,0 +1,123 @@
+import unittest
+from grid import (
+    WallGrid,
+    TOP,
+    RIGHT,
+    BOTTOM,
+    LEFT,
+    packed_size,
+    read_packed_header,
+)
+
+
+class TestWallGrid(unittest.TestCase):
+    def test_init_all_walls(self):
+        grid = WallGrid(3, 2)
+        self.assertEqual(len(grid), 6)
+        for index in range(len(grid)):
+            for side in (TOP, RIGHT, BOTTOM, LEFT):
+                self.assertTrue(grid.has_wall(index, side))
+
+    def test_init_zero_cells(self):
+        self.assertRaises(ValueError, WallGrid, 0, 0)
+
+    def test_index_coordinates(self):
+        grid = WallGrid(3, 2)
+        self.assertEqual(grid.index(2, 1), 5)
+        self.assertEqual(grid.coordinates(5), (2, 1))
+
+    def test_neighbor(self):
+        grid = WallGrid(3, 2)
+        self.assertEqual(grid.neighbor(4, TOP), 1)
+        self.assertEqual(grid.neighbor(4, RIGHT), 5)
+        self.assertEqual(grid.neighbor(1, BOTTOM), 4)
+        self.assertEqual(grid.neighbor(4, LEFT), 3)
+
+    def test_neighbor_edges(self):
+        grid = WallGrid(3, 2)
+        self.assertIsNone(grid.neighbor(0, TOP))
+        self.assertIsNone(grid.neighbor(2, RIGHT))
+        self.assertIsNone(grid.neighbor(3, BOTTOM))
+        self.assertIsNone(grid.neighbor(3, LEFT))
+
+    def test_set_wall(self):
+        grid = WallGrid(3, 2)
+        grid.set_wall(0, TOP, False)
+        self.assertFalse(grid.has_wall(0, TOP))
+        grid.set_wall(0, TOP, True)
+        self.assertTrue(grid.has_wall(0, TOP))
+        self.assertEqual(grid.version, 2)
+
+    def test_carve(self):
+        grid = WallGrid(3, 2)
+        self.assertEqual(grid.carve(1, BOTTOM), 4)
+        self.assertFalse(grid.has_wall(1, BOTTOM))
+        self.assertFalse(grid.has_wall(4, TOP))
+        self.assertTrue(grid.has_wall(1, TOP))
+
+    def test_carve_edge(self):
+        grid = WallGrid(3, 2)
+        self.assertRaises(ValueError, grid.carve, 0, LEFT)
+
+    def test_open_neighbors(self):
+        grid = WallGrid(3, 2)
+        grid.carve(1, BOTTOM)
+        grid.carve(1, LEFT)
+        grid.set_wall(1, TOP, False)
+        self.assertEqual(grid.open_neighbors(1), [4, 0])
+        self.assertEqual(grid.open_neighbors(2), [])
+
+    def test_degrees(self):
+        grid = WallGrid(3, 2)
+        grid.carve(1, BOTTOM)
+        grid.carve(1, LEFT)
+        grid.set_wall(0, TOP, False)
+        grid.set_wall(5, RIGHT, False)
+        self.assertEqual(grid.degrees(), bytearray([1, 2, 0, 0, 1, 0]))
+
+    def test_costs(self):
+        grid = WallGrid(3, 2)
+        self.assertIsNone(grid.costs)
+        self.assertEqual(grid.cost(4), 1)
+        self.assertEqual(grid.cost_range(), (1, 1))
+        grid.set_cost(4, 7)
+        self.assertEqual(grid.cost(4), 7)
+        self.assertEqual(grid.cost(3), 1)
+        self.assertEqual(grid.cost_range(), (1, 7))
+
+    def test_set_cost_invalid(self):
+        grid = WallGrid(3, 2)
+        self.assertRaises(ValueError, grid.set_cost, 0, 0)
+        self.assertRaises(ValueError, grid.set_cost, 0, 0x10000)
+
+    def test_pack_unpack(self):
+        for num_cols, num_rows in ((3, 2), (3, 3), (1, 1)):
+            grid = WallGrid(num_cols, num_rows)
+            for index in range(len(grid) - 1):
+                grid.set_wall(index, 1 << (index % 4), False)
+            grid.set_wall(len(grid) - 1, BOTTOM, False)
+            packed = grid.pack()
+            self.assertEqual(len(packed), packed_size(num_cols, num_rows))
+            unpacked = WallGrid.unpack(packed)
+            self.assertEqual(unpacked.num_cols, num_cols)
+            self.assertEqual(unpacked.num_rows, num_rows)
+            self.assertEqual(unpacked.passages, grid.passages)
+
+    def test_unpack_invalid(self):
+        packed = WallGrid(3, 2).pack()
+        self.assertRaises(ValueError, WallGrid.unpack, b"NOPE" + packed[4:])
+        self.assertRaises(ValueError, WallGrid.unpack, packed[:-1])
+        self.assertRaises(ValueError, WallGrid.unpack, packed[:8])
+
+    def test_read_packed_header(self):
+        self.assertEqual(read_packed_header(WallGrid(3, 2).pack()), (3, 2))
+
+    def test_reset_visited(self):
+        grid = WallGrid(3, 2)
+        grid.visited[3] = 1
+        grid.reset_visited()
+        self.assertEqual(grid.visited, bytearray(6))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+import random
+import unittest
+from unittest import mock
+from braid import braid
+from grid import WallGrid, TOP, RIGHT, BOTTOM, LEFT, OPPOSITE
+from incremental import IncrementalPlanner
+from search import cheapest_path, path_cost, shortest_path
+from tiling import generate_tiled
+
+
+class TestIncrementalPlanner(unittest.TestCase):
+    def test_shortest_path(self):
+        grid = WallGrid(20, 15)
+        generate_tiled(grid, 0, block_size=8, workers=1)
+        planner = IncrementalPlanner(grid, 0, len(grid) - 1)
+        expected_path = shortest_path(grid, 0, len(grid) - 1)
+        self.assertEqual(planner.shortest_path(), expected_path)
+
+    def test_same_cell(self):
+        grid = WallGrid(3, 3)
+        self.assertEqual(IncrementalPlanner(grid, 4, 4).shortest_path(), [4])
+
+    def test_unreachable(self):
+        grid = WallGrid(3, 3)
+        self.assertIsNone(IncrementalPlanner(grid, 0, 8).shortest_path())
+
+    def test_invalid_cells(self):
+        self.assertRaises(ValueError, IncrementalPlanner, WallGrid(3, 3), 0, 9)
+
+    def test_open_and_close_walls(self):
+        grid = WallGrid(3, 1)
+        planner = IncrementalPlanner(grid, 0, 2)
+        self.assertIsNone(planner.shortest_path())
+        grid.carve(0, RIGHT)
+        grid.carve(1, RIGHT)
+        planner.update_cells([0, 1, 2])
+        self.assertEqual(planner.shortest_path(), [0, 1, 2])
+        grid.set_wall(1, RIGHT, True)
+        grid.set_wall(2, LEFT, True)
+        planner.update_cells([1, 2])
+        self.assertIsNone(planner.shortest_path())
+        self.assertEqual(planner.version, grid.version)
+
+    def test_random_edits_match_bfs(self):
+        self._check_random_edits()
+
+    @mock.patch("incremental._REPAIR_SHARE", 2)
+    def test_random_edits_match_bfs_without_fallback(self):
+        self._check_random_edits()
+
+    def _check_random_edits(self):
+        rng = random.Random(0)
+        grid = WallGrid(16, 12)
+        generate_tiled(grid, 0, block_size=8, workers=1)
+        goal = len(grid) - 1
+        planner = IncrementalPlanner(grid, 0, goal)
+        for _ in range(50):
+            index = rng.randrange(len(grid))
+            side = rng.choice((TOP, RIGHT, BOTTOM, LEFT))
+            other = grid.neighbor(index, side)
+            if other is None:
+                continue
+            if grid.has_wall(index, side):
+                grid.carve(index, side)
+            else:
+                grid.set_wall(index, side, True)
+                grid.set_wall(other, OPPOSITE[side], True)
+            planner.update_cells([index, other])
+            expected = shortest_path(grid, 0, goal)
+            path = planner.shortest_path()
+            if expected is None:
+                self.assertIsNone(path)
+            else:
+                self.assertEqual(len(path), len(expected))
+
+    def test_close_walls_on_path(self):
+        grid = WallGrid(40, 40)
+        generate_tiled(grid, 0, block_size=8, workers=1)
+        braid(grid, 0.5, random.Random(2))
+        goal = len(grid) - 1
+        planner = IncrementalPlanner(grid, 0, goal)
+        sides = {-grid.num_cols: TOP, 1: RIGHT, grid.num_cols: BOTTOM, -1: LEFT}
+        rng = random.Random(3)
+        for _ in range(20):
+            path = planner.shortest_path()
+            expected = shortest_path(grid, 0, goal)
+            if expected is None:
+                self.assertIsNone(path)
+                break
+            self.assertEqual(len(path), len(expected))
+            position = rng.randrange(len(path) - 1)
+            index, other = path[position], path[position + 1]
+            side = sides[other - index]
+            grid.set_wall(index, side, True)
+            grid.set_wall(other, OPPOSITE[side], True)
+            planner.update_cells([index, other])
+
+    def test_cost_changes(self):
+        self._check_cost_changes()
+
+    @mock.patch("incremental._REPAIR_SHARE", 2)
+    def test_cost_changes_without_fallback(self):
+        self._check_cost_changes()
+
+    def _check_cost_changes(self):
+        grid = WallGrid(12, 10)
+        generate_tiled(grid, 0, block_size=4, workers=1)
+        for index in range(0, len(grid) - 12, 5):
+            if grid.has_wall(index, BOTTOM):
+                grid.carve(index, BOTTOM)
+        goal = len(grid) - 1
+        planner = IncrementalPlanner(grid, 0, goal)
+        rng = random.Random(1)
+        for _ in range(20):
+            index = rng.randrange(len(grid))
+            grid.set_cost(index, rng.randrange(1, 20))
+            planner.update_cells([index])
+            expected_cost = path_cost(grid, cheapest_path(grid, 0, goal))
+            self.assertEqual(path_cost(grid, planner.shortest_path()), expected_cost)
+
+    def test_cost_below_min_cost(self):
+        grid = WallGrid(3, 1)
+        grid.set_cost(1, 2)
+        grid.set_cost(0, 2)
+        grid.set_cost(2, 2)
+        planner = IncrementalPlanner(grid, 0, 2)
+        grid.set_cost(1, 1)
+        self.assertRaises(ValueError, planner.update_cells, [1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import random
+import unittest
+from braid import braid
+from grid import WallGrid, TOP, RIGHT, BOTTOM, LEFT
+from junctions import JunctionGraph
+from search import shortest_path
+from tiling import generate_tiled
+
+
+class TestJunctionGraph(unittest.TestCase):
+    def test_corridor_contracted(self):
+        grid = WallGrid(5, 1)
+        for index in range(4):
+            grid.carve(index, RIGHT)
+        junctions = JunctionGraph(grid)
+        self.assertEqual(len(junctions), 2)
+        self.assertEqual(junctions.neighbors(0), [(4, 4, 1)])
+        self.assertEqual(junctions.shortest_path(0, 4), [0, 1, 2, 3, 4])
+
+    def test_keep(self):
+        grid = WallGrid(5, 1)
+        for index in range(4):
+            grid.carve(index, RIGHT)
+        junctions = JunctionGraph(grid, keep=[2])
+        self.assertEqual(len(junctions), 3)
+        self.assertEqual(junctions.shortest_path(2, 4), [2, 3, 4])
+
+    def test_not_a_node(self):
+        grid = WallGrid(5, 1)
+        for index in range(4):
+            grid.carve(index, RIGHT)
+        junctions = JunctionGraph(grid)
+        self.assertRaises(ValueError, junctions.shortest_path, 0, 2)
+
+    def test_unreachable(self):
+        grid = WallGrid(3, 1)
+        grid.carve(0, RIGHT)
+        junctions = JunctionGraph(grid)
+        self.assertIsNone(junctions.shortest_path(0, 2))
+
+    def test_loop(self):
+        grid = WallGrid(2, 2)
+        grid.carve(0, RIGHT)
+        grid.carve(1, BOTTOM)
+        grid.carve(3, LEFT)
+        grid.carve(2, TOP)
+        junctions = JunctionGraph(grid, keep=[0, 3])
+        self.assertEqual(len(junctions.shortest_path(0, 3)), 3)
+
+    def test_matches_bfs(self):
+        grid = WallGrid(40, 30)
+        generate_tiled(grid, 0, block_size=16, workers=1)
+        goal = len(grid) - 1
+        junctions = JunctionGraph(grid, keep=[0, goal])
+        self.assertLess(len(junctions), len(grid))
+        expected_path = shortest_path(grid, 0, goal)
+        self.assertEqual(junctions.shortest_path(0, goal), expected_path)
+
+    def test_search_into_pruned_branch(self):
+        grid = WallGrid(40, 30)
+        generate_tiled(grid, 1, block_size=16, workers=1)
+        goal = len(grid) - 1
+        junctions = JunctionGraph(grid, keep=[0, goal])
+        degrees = grid.degrees()
+        dead_ends = [index for index in range(len(grid)) if degrees[index] == 1]
+        for start, end in ((0, dead_ends[0]), (dead_ends[-1], dead_ends[1])):
+            path = junctions.shortest_path(start, end)
+            self.assertEqual(path, shortest_path(grid, start, end))
+
+    def test_braided_matches_bfs(self):
+        grid = WallGrid(40, 30)
+        generate_tiled(grid, 2, block_size=16, workers=1)
+        braid(grid, 0.5, random.Random(0))
+        goal = len(grid) - 1
+        junctions = JunctionGraph(grid, keep=[0, goal])
+        self.assertEqual(
+            len(junctions.shortest_path(0, goal)), len(shortest_path(grid, 0, goal))
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,32 @@
+import os
+import subprocess
+import sys
+import tempfile
 import unittest
-from maze import Maze, Direction
+from unittest import mock
+from cache import MazeCache
+from maze import Maze, Direction, Algorithm, RenderMode, SolveMethod
+from search import path_cost
+
+
+class _RecordingWindow:
+    """Stands in for a ``Window``, recording the drawing calls it receives."""
+
+    def __init__(self):
+        self.calls = []
+
+    def redraw(self):
+        self.calls.append(("redraw",))
+
+    def draw_line(self, line, fill_color):
+        self.calls.append(("draw_line", fill_color))
+
+    def draw_image(self, ppm, x, y, item=None):
+        self.calls.append(("draw_image", item))
+        return 7 if item is None else item
+
+    def names(self):
+        return [call[0] for call in self.calls]
 
 
 class TestMaze(unittest.TestCase):
@@ -17,6 +44,20 @@ class TestMaze(unittest.TestCase):
         self.assertEqual(len(m1._cells), num_cols)
         self.assertEqual(len(m1._cells[0]), num_rows)
 
+    def test_maze_create_cells_lazy(self):
+        m1 = Maze(0, 0, 2000, 2000, 10, 10)
+        self.assertEqual(m1._cells._materialized, {})
+        self.assertIs(m1._cells[3][4], m1._cells[3][4])
+        self.assertEqual(len(m1._cells._materialized), 1)
+
+    def test_maze_cells_share_walls(self):
+        maze = Maze(0, 0, 10, 12, 10, 10, seed=0)
+        maze.generate_maze()
+        self.assertEqual(maze._cells[0][0].has_top_wall, False)
+        self.assertEqual(
+            maze._cells[0][0].has_right_wall, maze._cells[1][0].has_left_wall
+        )
+
     def test_maze_init_zero_cells(self):
         num_cols = 0
         num_rows = 0
@@ -185,6 +226,220 @@ class TestMaze(unittest.TestCase):
         cells_visited = [[row.visited for row in col] for col in maze._cells]
         self.assertEqual(cells_visited, expected_cells_visited)
 
+    def test_generate_maze_tiled(self):
+        maze = Maze(0, 0, 20, 30, 10, 10, seed=0)
+        maze.generate_maze(Algorithm.TILED, workers=1, block_size=8)
+        self.assertEqual(maze._cells[0][0].has_top_wall, False)
+        self.assertEqual(maze._cells[-1][-1].has_bottom_wall, False)
+        self.assertTrue(maze.solve())
+
+    def test_solve_bfs(self):
+        maze = Maze(0, 0, 10, 12, 10, 10, seed=0)
+        maze.generate_maze()
+        self.assertTrue(maze.solve(SolveMethod.BFS))
+        self.assertEqual(maze._cells[0][0].visited, True)
+        self.assertEqual(maze._cells[-1][-1].visited, True)
+
+    def test_solve_junction(self):
+        maze = Maze(0, 0, 10, 12, 10, 10, seed=0)
+        maze.generate_maze()
+        self.assertTrue(maze.solve(SolveMethod.JUNCTION))
+        junctions = maze._junctions
+        maze._reset_cells_visited()
+        self.assertTrue(maze.solve(SolveMethod.JUNCTION))
+        self.assertIs(maze._junctions, junctions)
+
+    def test_junction_graph_rebuilt_on_change(self):
+        maze = Maze(0, 0, 10, 12, 10, 10, seed=0)
+        maze.generate_maze()
+        junctions = maze._junction_graph()
+        maze._cells[3][3].has_left_wall = False
+        self.assertIsNot(maze._junction_graph(), junctions)
+
+    def test_find_path(self):
+        maze = Maze(0, 0, 10, 12, 10, 10, seed=0)
+        maze.generate_maze()
+        path = maze.find_path()
+        self.assertEqual(path[0], (0, 0))
+        self.assertEqual(path[-1], (11, 9))
+        self.assertEqual(maze.find_path(SolveMethod.JUNCTION), path)
+        self.assertEqual(maze.find_path(SolveMethod.INCREMENTAL), path)
+        self.assertEqual(maze._cells[0][0].visited, False)
+
+    def test_find_path_dfs(self):
+        maze = Maze(0, 0, 10, 12, 10, 10, seed=0)
+        self.assertRaises(ValueError, maze.find_path, SolveMethod.DFS)
+
+    def test_set_wall_replans(self):
+        maze = Maze(0, 0, 10, 12, 10, 10, seed=0)
+        maze.generate_maze()
+        maze.find_path(SolveMethod.INCREMENTAL)
+        planner = maze._planner
+        maze.set_wall(10, 9, Direction.RIGHT, True)
+        maze.set_wall(11, 8, Direction.DOWN, True)
+        self.assertIsNone(maze.find_path(SolveMethod.INCREMENTAL))
+        maze.set_wall(10, 9, Direction.RIGHT, False)
+        self.assertEqual(
+            maze.find_path(SolveMethod.INCREMENTAL), maze.find_path(SolveMethod.BFS)
+        )
+        self.assertIs(maze._planner, planner)
+
+    def test_set_wall_stale_planner(self):
+        maze = Maze(0, 0, 10, 12, 10, 10, seed=0)
+        maze.generate_maze()
+        maze.find_path(SolveMethod.INCREMENTAL)
+        planner = maze._planner
+        maze._cells[3][3].has_left_wall = False
+        maze.set_wall(3, 3, Direction.UP, False)
+        maze.find_path(SolveMethod.INCREMENTAL)
+        self.assertIsNot(maze._planner, planner)
+
+    def test_set_cell_cost(self):
+        maze = Maze(0, 0, 10, 12, 10, 10, seed=0)
+        maze.generate_maze(Algorithm.TILED, workers=1, block_size=4)
+        for i in range(0, 11):
+            maze.set_wall(i, 4, Direction.DOWN, False)
+        maze.find_path(SolveMethod.INCREMENTAL)
+        planner = maze._planner
+        for i in range(0, 12, 2):
+            maze.set_cell_cost(i, 5, 9)
+        costs = []
+        for method in (
+            SolveMethod.DIJKSTRA,
+            SolveMethod.JUNCTION,
+            SolveMethod.INCREMENTAL,
+        ):
+            path = [maze._grid.index(i, j) for i, j in maze.find_path(method)]
+            costs.append(path_cost(maze._grid, path))
+        self.assertEqual(costs, [costs[0]] * 3)
+        self.assertIs(maze._planner, planner)
+        self.assertTrue(maze.solve(SolveMethod.DIJKSTRA))
+
+    def test_set_cell_cost_invalid(self):
+        maze = Maze(0, 0, 10, 12, 10, 10)
+        self.assertRaises(ValueError, maze.set_cell_cost, 0, 0, 0)
+        self.assertRaises(ValueError, maze.set_cell_cost, 12, 0, 1)
+
+    def test_set_wall_edge(self):
+        maze = Maze(0, 0, 10, 12, 10, 10)
+        self.assertRaises(ValueError, maze.set_wall, 0, 0, Direction.UP, False)
+
+    def test_analyze(self):
+        maze = Maze(0, 0, 10, 12, 10, 10, seed=0)
+        maze.generate_maze()
+        metrics = maze.analyze()
+        self.assertEqual(metrics.solution_length, maze.distance_field()[-1])
+        self.assertGreater(metrics.dead_ends, 0)
+
+    def test_distance_field(self):
+        maze = Maze(0, 0, 10, 12, 10, 10, seed=0)
+        maze.generate_maze()
+        distances = maze.distance_field()
+        self.assertEqual(distances[0], 0)
+        self.assertNotIn(-1, distances)
+
+    def test_distance_field_out_of_bounds(self):
+        maze = Maze(0, 0, 10, 12, 10, 10)
+        self.assertRaises(ValueError, maze.distance_field, [(12, 0)])
+
+    def test_generate_maze_braid(self):
+        maze = Maze(0, 0, 20, 30, 10, 10, seed=0)
+        maze.generate_maze(braid=1)
+        self.assertEqual(maze.analyze().dead_ends, 0)
+        path = maze.find_path(SolveMethod.BFS)
+        for method in (SolveMethod.DIJKSTRA, SolveMethod.JUNCTION):
+            self.assertEqual(len(maze.find_path(method)), len(path))
+        self.assertTrue(maze.solve())
+
+    def test_generate_maze_braid_invalid(self):
+        maze = Maze(0, 0, 10, 10, 10, 10)
+        self.assertRaises(ValueError, maze.generate_maze, braid=-0.5)
+
+    def test_generate_maze_cached(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = MazeCache(directory)
+            first = Maze(0, 0, 10, 12, 10, 10, seed=3, cache=cache)
+            first.generate_maze(braid=0.5)
+            path = first.find_path()
+            second = Maze(0, 0, 10, 12, 10, 10, seed=3, cache=cache)
+            second._break_walls_r = None
+            second.generate_maze(braid=0.5)
+            self.assertEqual(second._grid.passages, first._grid.passages)
+            self.assertEqual(second.find_path(), path)
+            self.assertEqual(len(os.listdir(directory)), 1)
+            self.assertTrue(second.solve(SolveMethod.BFS))
+
+    def test_generate_maze_cached_interleaved(self):
+        reference = Maze(0, 0, 10, 12, 10, 10, seed=1)
+        reference.generate_maze()
+        with tempfile.TemporaryDirectory() as directory:
+            cache = MazeCache(directory)
+            first = Maze(0, 0, 10, 12, 10, 10, seed=1, cache=cache)
+            other = Maze(0, 0, 10, 12, 10, 10, seed=2, cache=cache)
+            first.generate_maze()
+            other.generate_maze()
+            self.assertEqual(first._grid.passages, reference._grid.passages)
+            cached = Maze(0, 0, 10, 12, 10, 10, seed=1, cache=cache)
+            cached.generate_maze()
+            self.assertEqual(cached._grid.passages, reference._grid.passages)
+
+    def test_generate_maze_cache_wrong_size(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = MazeCache(directory)
+            small = Maze(0, 0, 5, 6, 10, 10, seed=3, cache=cache)
+            small.generate_maze()
+            reference = Maze(0, 0, 10, 12, 10, 10, seed=3)
+            reference.generate_maze()
+            maze = Maze(0, 0, 10, 12, 10, 10, seed=3, cache=cache)
+            maze._load_cached(Algorithm.BACKTRACKER, 128, 0.0)
+            cache.put(maze._cache_key, small._grid, [0, 1])
+            maze.generate_maze()
+            self.assertEqual(maze._grid.passages, reference._grid.passages)
+            self.assertEqual(len(maze._grid.passages), 120)
+            self.assertTrue(maze.solve(SolveMethod.BFS))
+
+    def test_generate_maze_cache_needs_seed(self):
+        with tempfile.TemporaryDirectory() as directory:
+            maze = Maze(0, 0, 10, 12, 10, 10, cache=MazeCache(directory))
+            maze.generate_maze()
+            self.assertEqual(os.listdir(directory), [])
+
+    def test_render_mode_image_headless(self):
+        maze = Maze(0, 0, 10, 12, 10, 10, seed=0, render_mode=RenderMode.IMAGE)
+        maze.generate_maze()
+        self.assertTrue(maze.solve())
+        self.assertIsNone(maze._image_item)
+
+    @mock.patch("maze.sleep")
+    def test_render_mode_image_window(self, sleep):
+        window = _RecordingWindow()
+        maze = Maze(0, 0, 6, 8, 10, 10, window, seed=0, render_mode=RenderMode.IMAGE)
+        maze.generate_maze()
+        self.assertIn("draw_image", window.names())
+        self.assertNotIn("draw_line", window.names())
+        self.assertEqual(maze._image_item, 7)
+
+        window.calls.clear()
+        maze.set_wall(0, 0, Direction.RIGHT, True)
+        self.assertEqual(window.calls[0], ("draw_image", 7))
+        self.assertEqual(maze._image_item, 7)
+
+        window.calls.clear()
+        maze.set_wall(0, 0, Direction.RIGHT, False)
+        window.calls.clear()
+        self.assertTrue(maze.solve(SolveMethod.BFS))
+        self.assertIn("draw_line", window.names())
+        self.assertNotIn("draw_image", window.names())
+
+    def test_import_without_tkinter(self):
+        result = subprocess.run(
+            [sys.executable, "-c", "import sys, maze; print('tkinter' in sys.modules)"],
+            capture_output=True,
+            text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        )
+        self.assertEqual(result.stdout.strip(), "False")
+
     def test_reset_cells_visited(self):
         maze = Maze(0, 0, 10, 10, 10, 10)
         maze._cells[4][4].visited = True
@@ -0,0 +1,48 @@
+import unittest
+from profiler import Profiler
+from maze import Maze
+
+
+class TestProfiler(unittest.TestCase):
+    def test_count(self):
+        profiler = Profiler()
+        profiler.count("a")
+        profiler.count("a", 2)
+        self.assertEqual(profiler.report()["counters"], {"a": 3})
+
+    def test_phase(self):
+        profiler = Profiler()
+        with profiler.phase("a"):
+            pass
+        with profiler.phase("a"):
+            pass
+        phases = profiler.report()["phases"]
+        self.assertEqual(phases["a"]["calls"], 2)
+        self.assertGreaterEqual(phases["a"]["seconds"], 0)
+
+    def test_reset(self):
+        profiler = Profiler()
+        profiler.count("a")
+        with profiler.phase("b"):
+            pass
+        profiler.reset()
+        self.assertEqual(profiler.report(), {"counters": {}, "phases": {}})
+
+    def test_maze_report(self):
+        profiler = Profiler()
+        maze = Maze(0, 0, 10, 12, 10, 10, seed=0, profiler=profiler)
+        maze.generate_maze()
+        maze.solve()
+        report = profiler.report()
+        counters = report["counters"]
+        self.assertEqual(counters["generate_cells_visited"], 120)
+        self.assertEqual(counters["generate_backtracks"], 120)
+        self.assertGreater(counters["get_visitable_cells_calls"], 0)
+        self.assertGreater(counters["solve_cells_visited"], 0)
+        self.assertNotIn("draw_calls", counters)
+        for phase in ("create_cells", "generate_maze", "solve"):
+            self.assertEqual(report["phases"][phase]["calls"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
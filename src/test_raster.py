@@ -0,0 +1,45 @@
+import unittest
+from grid import WallGrid, TOP, RIGHT
+from raster import rasterize
+
+_header = b"P6\n8 6\n255\n"
+_wall = b"\x00\x00\x00"
+_absent = b"\xd9\xd9\xd9"
+
+
+def pixel(ppm: bytes, x: int, y: int) -> bytes:
+    start = len(_header) + (y * 8 + x) * 3
+    return ppm[start : start + 3]
+
+
+class TestRaster(unittest.TestCase):
+    def test_header(self):
+        ppm = rasterize(WallGrid(2, 1), 3, 4)
+        self.assertTrue(ppm.startswith(_header))
+        self.assertEqual(len(ppm), len(_header) + 8 * 6 * 3)
+
+    def test_all_walls(self):
+        ppm = rasterize(WallGrid(2, 1), 3, 4)
+        self.assertEqual(pixel(ppm, 0, 0), _wall)
+        self.assertEqual(pixel(ppm, 3, 3), _wall)
+        self.assertEqual(pixel(ppm, 7, 5), _wall)
+        self.assertEqual(pixel(ppm, 2, 3), _absent)
+
+    def test_open_walls(self):
+        grid = WallGrid(2, 1)
+        grid.carve(0, RIGHT)
+        grid.set_wall(0, TOP, False)
+        ppm = rasterize(grid, 3, 4)
+        self.assertEqual(pixel(ppm, 3, 3), _absent)
+        self.assertEqual(pixel(ppm, 2, 0), _absent)
+        self.assertEqual(pixel(ppm, 5, 0), _wall)
+
+    def test_one_sided_wall(self):
+        grid = WallGrid(2, 1)
+        grid.set_wall(0, RIGHT, False)
+        ppm = rasterize(grid, 3, 4)
+        self.assertEqual(pixel(ppm, 3, 3), _wall)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import unittest
+from grid import WallGrid, RIGHT, BOTTOM
+from junctions import JunctionGraph
+from search import (
+    cheapest_path,
+    distance_field,
+    path_cost,
+    shortest_path,
+    UNREACHED,
+)
+from tiling import generate_tiled
+
+
+def corridor_grid() -> WallGrid:
+    # 0 - 1 - 2
+    #         |
+    # 3   4 - 5
+    grid = WallGrid(3, 2)
+    grid.carve(0, RIGHT)
+    grid.carve(1, RIGHT)
+    grid.carve(2, BOTTOM)
+    grid.carve(4, RIGHT)
+    return grid
+
+
+class TestSearch(unittest.TestCase):
+    def test_distance_field(self):
+        distances = distance_field(corridor_grid(), [0])
+        self.assertEqual(list(distances), [0, 1, 2, UNREACHED, 4, 3])
+
+    def test_distance_field_multiple_sources(self):
+        distances = distance_field(corridor_grid(), [0, 4])
+        self.assertEqual(list(distances), [0, 1, 2, UNREACHED, 0, 1])
+
+    def test_distance_field_target(self):
+        distances = distance_field(corridor_grid(), [0], target=1)
+        self.assertEqual(distances[1], 1)
+        self.assertEqual(distances[4], UNREACHED)
+
+    def test_distance_field_ignores_exterior(self):
+        grid = corridor_grid()
+        grid.set_wall(2, RIGHT, False)
+        grid.set_wall(5, BOTTOM, False)
+        distances = distance_field(grid, [0])
+        self.assertEqual(distances[3], UNREACHED)
+
+    def test_distance_field_no_sources(self):
+        self.assertRaises(ValueError, distance_field, corridor_grid(), [])
+
+    def test_distance_field_invalid_source(self):
+        self.assertRaises(ValueError, distance_field, corridor_grid(), [6])
+
+    def test_shortest_path(self):
+        self.assertEqual(shortest_path(corridor_grid(), 0, 4), [0, 1, 2, 5, 4])
+
+    def test_shortest_path_same_cell(self):
+        self.assertEqual(shortest_path(corridor_grid(), 1, 1), [1])
+
+    def test_shortest_path_unreachable(self):
+        self.assertIsNone(shortest_path(corridor_grid(), 0, 3))
+
+    def test_shortest_path_generated(self):
+        grid = WallGrid(40, 30)
+        generate_tiled(grid, 0, block_size=16, workers=1)
+        distances = distance_field(grid, [0])
+        path = shortest_path(grid, 0, len(grid) - 1)
+        self.assertEqual(len(path), distances[-1] + 1)
+
+    def test_cheapest_path_unweighted(self):
+        grid = WallGrid(40, 30)
+        generate_tiled(grid, 0, block_size=16, workers=1)
+        expected_path = shortest_path(grid, 0, len(grid) - 1)
+        self.assertEqual(cheapest_path(grid, 0, len(grid) - 1), expected_path)
+
+    def test_cheapest_path_avoids_costly_cells(self):
+        grid = WallGrid(3, 3)
+        for index in (0, 1, 3, 4, 6, 7):
+            grid.carve(index, RIGHT)
+        for index in range(6):
+            grid.carve(index, BOTTOM)
+        grid.set_cost(4, 50)
+        grid.set_cost(1, 3)
+        for use_heuristic in (True, False):
+            path = cheapest_path(grid, 3, 5, use_heuristic)
+            self.assertEqual(path, [3, 6, 7, 8, 5])
+            self.assertEqual(path_cost(grid, path), 4)
+
+    def test_cheapest_path_matches_junction_graph(self):
+        grid = WallGrid(30, 20)
+        generate_tiled(grid, 0, block_size=8, workers=1)
+        for index in range(0, len(grid), 7):
+            grid.set_cost(index, index % 13 + 1)
+        for index in range(0, len(grid) - 30, 11):
+            if grid.has_wall(index, BOTTOM):
+                grid.carve(index, BOTTOM)
+        goal = len(grid) - 1
+        junctions = JunctionGraph(grid, keep=[0, goal])
+        expected_cost = path_cost(grid, junctions.shortest_path(0, goal))
+        for use_heuristic in (True, False):
+            path = cheapest_path(grid, 0, goal, use_heuristic)
+            self.assertEqual(path_cost(grid, path), expected_cost)
+
+    def test_cheapest_path_unreachable(self):
+        self.assertIsNone(cheapest_path(corridor_grid(), 0, 3))
+
+
+if __name__ == "__main__":
+    unittest.main()
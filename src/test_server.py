@@ -0,0 +1,161 @@
+import tempfile
+import threading
+import unittest
+import urllib.error
+import urllib.request
+from cache import decode_entry
+from grid import BOTTOM
+from profiler import Profiler
+from search import shortest_path
+from server import MazeService, parse_request
+
+
+class TestParseRequest(unittest.TestCase):
+    def test_defaults(self):
+        self.assertEqual(
+            parse_request("rows=2&cols=3", 100),
+            (2, 3, None, "TILED", 128, 0.0, False),
+        )
+
+    def test_all_parameters(self):
+        query = "rows=2&cols=3&seed=7&algorithm=backtracker&block_size=4&braid=0.5"
+        self.assertEqual(
+            parse_request(query + "&solve=true", 100),
+            (2, 3, 7, "BACKTRACKER", 4, 0.5, True),
+        )
+
+    def test_invalid(self):
+        for query in (
+            "rows=2",
+            "rows=2&cols=x",
+            "rows=0&cols=3",
+            "rows=20&cols=30",
+            "rows=2&cols=3&algorithm=prim",
+            "rows=2&cols=3&braid=2",
+            "rows=2&cols=3&block_size=0",
+            "rows=2&cols=3&solve=maybe",
+            "rows=2&cols=3&colour=red",
+        ):
+            with self.subTest(query=query):
+                self.assertRaises(ValueError, parse_request, query, 100)
+
+    def test_backtracker_limit(self):
+        self.assertEqual(
+            parse_request("rows=30&cols=30&algorithm=backtracker", 10000)[3],
+            "BACKTRACKER",
+        )
+        self.assertRaises(
+            ValueError,
+            parse_request,
+            "rows=30&cols=31&algorithm=backtracker",
+            10000,
+        )
+
+
+class TestMazeService(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.profiler = Profiler()
+        cls.service = MazeService(workers=1, batch_window=0.05, profiler=cls.profiler)
+        cls.service.start()
+        host, port = cls.service.address
+        cls.url = f"http://{host}:{port}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.service.close()
+
+    def _get(self, query, path="/maze"):
+        with urllib.request.urlopen(self.url + path + "?" + query, timeout=30) as r:
+            return r.read()
+
+    def test_generate(self):
+        entry = decode_entry(self._get("rows=20&cols=30&seed=1&block_size=8"))
+        self.assertEqual((entry.grid.num_cols, entry.grid.num_rows), (30, 20))
+        self.assertFalse(entry.grid.has_wall(len(entry.grid) - 1, BOTTOM))
+        self.assertIsNone(entry.solution)
+
+    def test_generate_deterministic(self):
+        query = "rows=10&cols=10&seed=2&block_size=4"
+        self.assertEqual(self._get(query), self._get(query))
+
+    def test_solve(self):
+        entry = decode_entry(self._get("rows=10&cols=12&seed=3&solve=1"))
+        self.assertEqual(
+            entry.solution, shortest_path(entry.grid, 0, len(entry.grid) - 1)
+        )
+
+    def test_concurrent_requests_batched(self):
+        queries = [f"rows=8&cols=8&seed={seed % 3}&solve=1" for seed in range(6)]
+        results = [None] * len(queries)
+
+        def fetch(position):
+            results[position] = self._get(queries[position])
+
+        before = dict(self.profiler.counters)
+        threads = [threading.Thread(target=fetch, args=(k,)) for k in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        counters = self.profiler.counters
+        self.assertEqual(results[:3], results[3:])
+        self.assertEqual(
+            counters["service_requests"] - before.get("service_requests", 0), 6
+        )
+        self.assertLess(
+            counters["service_batches"] - before.get("service_batches", 0), 6
+        )
+        self.assertGreater(
+            counters["service_deduplicated"]
+            - before.get("service_deduplicated", 0),
+            0,
+        )
+
+    def test_bad_request(self):
+        with self.assertRaises(urllib.error.HTTPError) as context:
+            self._get("rows=0&cols=3")
+        self.assertEqual(context.exception.code, 400)
+
+    def test_not_found(self):
+        with self.assertRaises(urllib.error.HTTPError) as context:
+            self._get("rows=2&cols=3", path="/other")
+        self.assertEqual(context.exception.code, 404)
+
+    def test_backtracker(self):
+        entry = decode_entry(self._get("rows=1&cols=900&algorithm=backtracker"))
+        self.assertEqual(len(entry.grid), 900)
+
+    def test_backtracker_too_large(self):
+        with self.assertRaises(urllib.error.HTTPError) as context:
+            self._get("rows=100&cols=100&algorithm=backtracker")
+        self.assertEqual(context.exception.code, 400)
+        self.assertIn("algorithm=tiled", context.exception.reason)
+
+
+class TestMazeServiceCache(unittest.TestCase):
+    def test_cache_directory(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with MazeService(workers=1, cache_directory=directory) as service:
+                future = service.submit((6, 6, 4, "TILED", 4, 0.0, True))
+                data = future.result(timeout=30)
+            self.assertEqual(decode_entry(data).solution[0], 0)
+            with MazeService(workers=1, cache_directory=directory) as service:
+                self.assertEqual(
+                    service.submit((6, 6, 4, "TILED", 4, 0.0, True)).result(30),
+                    data,
+                )
+
+    def test_submit_after_close(self):
+        service = MazeService(workers=1)
+        service.close()
+        self.assertRaises(
+            RuntimeError, service.submit, (2, 2, None, "TILED", 4, 0.0, False)
+        )
+
+    def test_invalid_workers(self):
+        self.assertRaises(ValueError, MazeService, workers=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
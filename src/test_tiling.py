@@ -0,0 +1,58 @@
+import unittest
+from collections import deque
+from grid import WallGrid, TOP, RIGHT, BOTTOM, LEFT
+from tiling import generate_tiled
+
+
+def is_perfect(grid: WallGrid) -> bool:
+    edges = sum(
+        bin(passages & (RIGHT | BOTTOM)).count("1") for passages in grid.passages
+    )
+    if edges != len(grid) - 1:
+        return False
+    seen = bytearray(len(grid))
+    seen[0] = 1
+    queue = deque([0])
+    while queue:
+        index = queue.popleft()
+        for side in (TOP, RIGHT, BOTTOM, LEFT):
+            other = grid.neighbor(index, side)
+            if other is not None and not grid.has_wall(index, side):
+                if not seen[other]:
+                    seen[other] = 1
+                    queue.append(other)
+    return all(seen)
+
+
+class TestTiling(unittest.TestCase):
+    def test_generate_tiled_single_block(self):
+        grid = WallGrid(12, 10)
+        generate_tiled(grid, 0, block_size=16, workers=1)
+        self.assertTrue(is_perfect(grid))
+
+    def test_generate_tiled_serial(self):
+        grid = WallGrid(45, 31)
+        generate_tiled(grid, 0, block_size=8, workers=1)
+        self.assertTrue(is_perfect(grid))
+
+    def test_generate_tiled_parallel_matches_serial(self):
+        serial = WallGrid(45, 31)
+        generate_tiled(serial, 1, block_size=8, workers=1)
+        parallel = WallGrid(45, 31)
+        generate_tiled(parallel, 1, block_size=8, workers=2)
+        self.assertEqual(parallel.passages, serial.passages)
+
+    def test_generate_tiled_single_cell_blocks(self):
+        grid = WallGrid(5, 4)
+        generate_tiled(grid, 0, block_size=1, workers=1)
+        self.assertTrue(is_perfect(grid))
+
+    def test_generate_tiled_invalid_block_size(self):
+        self.assertRaises(ValueError, generate_tiled, WallGrid(5, 4), 0, 0)
+
+    def test_generate_tiled_invalid_workers(self):
+        self.assertRaises(ValueError, generate_tiled, WallGrid(5, 4), 0, 8, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
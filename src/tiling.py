@@ -0,0 +1,197 @@
+import os
+import random
+from grid import WallGrid, TOP, RIGHT, BOTTOM, LEFT, OPPOSITE
+
+Block = tuple[int, int, int, int]
+
+
+def _blocks(grid: WallGrid, block_size: int) -> list[Block]:
+    """Splits a grid into rectangular blocks, row by row.
+
+    Args:
+        grid (WallGrid): The grid to split.
+        block_size (int): The maximum width and height of each block.
+
+    Returns:
+        list[Block]: The ``(i0, j0, i1, j1)`` bounds of each block, with the
+        end bounds exclusive.
+    """
+    blocks = []
+    for j0 in range(0, grid.num_rows, block_size):
+        for i0 in range(0, grid.num_cols, block_size):
+            i1 = min(i0 + block_size, grid.num_cols)
+            j1 = min(j0 + block_size, grid.num_rows)
+            blocks.append((i0, j0, i1, j1))
+    return blocks
+
+
+def _carve_block(passages, num_cols: int, block: Block, seed: str) -> None:
+    """Generates a perfect maze within a single block using an iterative
+    randomized depth-first search. Only cells inside the block are modified, so
+    blocks can be carved concurrently into the same buffer.
+
+    Args:
+        passages: The writable ``passages`` buffer of the grid.
+        num_cols (int): The number of columns in the whole grid.
+        block (Block): The bounds of the block to carve.
+        seed (str): The seed for this block's random number generator.
+    """
+    i0, j0, i1, j1 = block
+    width = i1 - i0
+    height = j1 - j0
+    rng = random.Random(seed)
+    visited = bytearray(width * height)
+    start = rng.randrange(width * height)
+    visited[start] = 1
+    stack = [start]
+    while stack:
+        local = stack[-1]
+        bj, bi = divmod(local, width)
+        options = []
+        if bj > 0 and not visited[local - width]:
+            options.append((local - width, TOP, -num_cols))
+        if bi < width - 1 and not visited[local + 1]:
+            options.append((local + 1, RIGHT, 1))
+        if bj < height - 1 and not visited[local + width]:
+            options.append((local + width, BOTTOM, num_cols))
+        if bi > 0 and not visited[local - 1]:
+            options.append((local - 1, LEFT, -1))
+        if not options:
+            stack.pop()
+            continue
+        next_local, side, offset = options[rng.randrange(len(options))]
+        visited[next_local] = 1
+        index = (j0 + bj) * num_cols + i0 + bi
+        passages[index] |= side
+        passages[index + offset] |= OPPOSITE[side]
+        stack.append(next_local)
+
+
+def _carve_block_shared(name: str, num_cols: int, block: Block, seed: str) -> None:
+    """Worker entry point for ``_carve_block``, carving into a grid held in
+    shared memory.
+
+    Args:
+        name (str): The name of the ``SharedMemory`` holding the passages.
+        num_cols (int): The number of columns in the whole grid.
+        block (Block): The bounds of the block to carve.
+        seed (str): The seed for this block's random number generator.
+    """
+    from multiprocessing.shared_memory import SharedMemory
+
+    shm = SharedMemory(name=name)
+    try:
+        _carve_block(shm.buf, num_cols, block, seed)
+    finally:
+        shm.close()
+
+
+def _stitch_blocks(
+    grid: WallGrid, blocks: list[Block], block_size: int, rng: random.Random
+) -> None:
+    """Connects the blocks along a random spanning tree of the block grid,
+    opening a single wall on each shared boundary in the tree. Since every
+    block is itself a perfect maze, the result is one perfect maze.
+
+    Args:
+        grid (WallGrid): The grid whose blocks have been carved.
+        blocks (list[Block]): The blocks, as returned by ``_blocks``.
+        block_size (int): The block size used to split the grid.
+        rng (random.Random): The random number generator to use.
+    """
+    blocks_per_row = -(-grid.num_cols // block_size)
+    blocks_per_col = -(-grid.num_rows // block_size)
+    visited = bytearray(len(blocks))
+    start = rng.randrange(len(blocks))
+    visited[start] = 1
+    stack = [start]
+    while stack:
+        current = stack[-1]
+        by, bx = divmod(current, blocks_per_row)
+        options = []
+        if by > 0 and not visited[current - blocks_per_row]:
+            options.append((current - blocks_per_row, TOP))
+        if bx < blocks_per_row - 1 and not visited[current + 1]:
+            options.append((current + 1, RIGHT))
+        if by < blocks_per_col - 1 and not visited[current + blocks_per_row]:
+            options.append((current + blocks_per_row, BOTTOM))
+        if bx > 0 and not visited[current - 1]:
+            options.append((current - 1, LEFT))
+        if not options:
+            stack.pop()
+            continue
+        other, side = options[rng.randrange(len(options))]
+        visited[other] = 1
+        i0, j0, i1, j1 = blocks[current]
+        if side == TOP:
+            index = grid.index(rng.randrange(i0, i1), j0)
+        elif side == RIGHT:
+            index = grid.index(i1 - 1, rng.randrange(j0, j1))
+        elif side == BOTTOM:
+            index = grid.index(rng.randrange(i0, i1), j1 - 1)
+        else:
+            index = grid.index(i0, rng.randrange(j0, j1))
+        grid.carve(index, side)
+        stack.append(other)
+
+
+def generate_tiled(
+    grid: WallGrid, seed: int, block_size: int = 128, workers: int | None = None
+) -> None:
+    """Generates a perfect maze by splitting the grid into blocks, carving each
+    block in a separate process on a shared copy of the grid, and finally
+    stitching the blocks together. The result depends only on ``seed`` and
+    ``block_size``, not on the number of workers.
+
+    Args:
+        grid (WallGrid): The grid to generate the maze in, with all interior
+        walls standing.
+        seed (int): The seed for the random number generators.
+        block_size (int, optional): The maximum width and height of each block.
+        Defaults to 128.
+        workers (int | None, optional): The number of worker processes. If
+        ``None``, one per CPU is used. With a single worker or a single block,
+        the maze is carved in the current process. Defaults to None.
+
+    Raises:
+        ValueError: Raises ValueError if ``block_size`` or ``workers`` are not
+        at least 1.
+    """
+    if block_size <= 0:
+        raise ValueError("Blocks must be at least 1 cell wide and 1 cell tall")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 0:
+        raise ValueError("At least 1 worker is required")
+
+    blocks = _blocks(grid, block_size)
+    seeds = [f"{seed}/{index}" for index in range(len(blocks))]
+    if workers == 1 or len(blocks) == 1:
+        for block, block_seed in zip(blocks, seeds):
+            _carve_block(grid.passages, grid.num_cols, block, block_seed)
+    else:
+        # Only pay for importing multiprocessing when it is actually used.
+        from concurrent.futures import ProcessPoolExecutor
+        from multiprocessing.shared_memory import SharedMemory
+
+        shm = SharedMemory(create=True, size=len(grid))
+        try:
+            shm.buf[: len(grid)] = grid.passages
+            with ProcessPoolExecutor(min(workers, len(blocks))) as executor:
+                list(
+                    executor.map(
+                        _carve_block_shared,
+                        [shm.name] * len(blocks),
+                        [grid.num_cols] * len(blocks),
+                        blocks,
+                        seeds,
+                        chunksize=max(1, len(blocks) // (workers * 4)),
+                    )
+                )
+            grid.passages[:] = shm.buf[: len(grid)]
+        finally:
+            shm.close()
+            shm.unlink()
+
+    _stitch_blocks(grid, blocks, block_size, random.Random(f"{seed}/stitch"))
+    grid.version += 1
@@ -1,16 +1,21 @@
-from tkinter import Tk, BOTH, Canvas
+from tkinter import Tk, BOTH, Canvas, NW, PhotoImage
 from line import Line
+from profiler import Profiler
 
 
 class Window:
     """A class representing the main window for the maze solver."""
 
-    def __init__(self, width: int, height: int) -> None:
+    def __init__(
+        self, width: int, height: int, profiler: Profiler | None = None
+    ) -> None:
         """Creates a new main window for the maze solver.
 
         Args:
             width (int): Window width in pixels
             height (int): Window height in pixels
+            profiler (Profiler | None): Optional profiler counting the canvas
+            items created. Defaults to None.
         """
         self.__root = Tk()
         self.__root.geometry(f"{width}x{height}")
@@ -23,6 +28,8 @@ class Window:
         self.__canvas.pack(expand=1)
 
         self.__running = False
+        self.__profiler = profiler
+        self.__images: dict[int, PhotoImage] = {}
 
     def redraw(self) -> None:
         """Redraws the main window."""
@@ -50,4 +57,32 @@ class Window:
             line (Line): The line to draw
             fill_color (str): The color to use to draw the line
         """
+        if self.__profiler is not None:
+            self.__profiler.count("canvas_items")
         line.draw(self.__canvas, fill_color)
+
+    def draw_image(self, ppm: bytes, x: int, y: int, item: int | None = None) -> int:
+        """Draws a PPM image on the window's canvas as a single canvas item.
+
+        Args:
+            ppm (bytes): The image, in binary PPM format
+            x (int): X-coordinate of the top-left corner of the image
+            y (int): Y-coordinate of the top-left corner of the image
+            item (int | None): An image item previously returned by this
+            function to replace the image of, keeping its place in the drawing
+            order. Defaults to None, which creates a new item.
+
+        Returns:
+            int: The canvas item showing the image
+        """
+        image = PhotoImage(data=ppm, format="PPM")
+        if item is None:
+            if self.__profiler is not None:
+                self.__profiler.count("canvas_items")
+            item = self.__canvas.create_image(x, y, image=image, anchor=NW)
+        else:
+            self.__canvas.coords(item, x, y)
+            self.__canvas.itemconfigure(item, image=image)
+        # Tk does not hold a reference to the image, so keep it alive here.
+        self.__images[item] = image
+        return item